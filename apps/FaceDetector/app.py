@@ -33,12 +33,21 @@ Authors:
     - Davide De Tommaso (davide.detommaso@iit.it)
 """
 
-import cv2
 import numpy as np
-import mediapipe as mp
 import yarp
 import sys
+import time
 from pyicub.core.logger import YarpLogger
+from frames import YarpFrameAdapter, source_stamp
+from pipeline import FramePipeline, LatestFrameSlot
+from roi import RoiTracker
+from backends import create_backend, backend_options
+from tracker import FaceTracker
+from gating import MotionGate
+from debug import DebugPublisher
+from stats import FrameProfiler, StageStats
+
+STAGES = ("acquire", "convert", "age", "gate", "detect", "output", "process")
 
 VOCAB_QUIT = yarp.createVocab32("q", "u", "i", "t")
 
@@ -46,17 +55,36 @@ class iFaceDetector(yarp.RFModule):
     def __init__(self):
         super().__init__()
         self.display = False
+        self.pipelined = False
         self.period = 0.1  # default update period
+        self.stats_period = 5.0
+        self.metrics_period = 1.0
 
-        # Tracking & MediaPipe
-        mp_pose = mp.solutions.pose
-        self.pose = mp_pose.Pose(static_image_mode=False, model_complexity=1, smooth_landmarks=True)
+        # Detector backend, created in configure()
+        self.backend_name = "pose"
+        self.detector = None
 
         self.logs = YarpLogger.getLogger()
 
+        self.frames = None
+        self.pipeline = None
+        self.roi = None
+        self.tracker = None
+        self.gate = None
+        self.debug = None
+        self._last_stats_log = 0.0
+        self._last_metrics = 0.0
+
+        # Per-stage latency histograms and the runtime profiling hook
+        self.timers = StageStats(STAGES)
+        self.profiler = FrameProfiler()
+        self._detected_at = None
+
         # YARP ports
         self.input_port = yarp.BufferedPortImageRgb()
         self.output_port = yarp.BufferedPortBottle()
+        self.faces_port = yarp.BufferedPortBottle()
+        self.metrics_port = yarp.BufferedPortBottle()
         self.rpc_port = yarp.RpcClient()
         self.cmd_port = yarp.Port()  # for receiving commands
 
@@ -65,14 +93,70 @@ class iFaceDetector(yarp.RFModule):
 
 
         self.display = rf.check("display") and rf.find("display").asBool()
+        self.display_rate = rf.check("display_rate", yarp.Value(5.0)).asFloat64()
         self.period = rf.check("period") and rf.find("period").asFloat64() or 0.1
+        self.pipelined = rf.check("pipelined") and rf.find("pipelined").asBool()
+        self.stats_period = rf.check("stats_period") and rf.find("stats_period").asFloat64() or 5.0
+        self.metrics_period = rf.check("metrics_period", yarp.Value(1.0)).asFloat64()
+
+        self.backend_name = rf.check("backend", yarp.Value("pose")).asString()
+        roi_tracking = rf.check("roi_tracking") and rf.find("roi_tracking").asBool()
+        multi_face = rf.check("multi_face") and rf.find("multi_face").asBool()
+        try:
+            # ROI crops move and change size between frames: a tracking backend would see jumps
+            static = roi_tracking and not multi_face
+            self.detector = create_backend(self.backend_name, **backend_options(rf, self.backend_name, static))
+        except Exception as e:
+            self.logs.error("[%s] Failed to create '%s' detector: %s" % (self.getName(), self.backend_name, str(e)))
+            return False
+        self.logs.info("[%s] Using '%s' detector backend." % (self.getName(), self.backend_name))
+        if getattr(self.detector, "warmup_time", None) is not None:
+            self.logs.info("[%s] Detector warm-up: %.1f ms per inference." % (self.getName(), 1e3 * self.detector.warmup_time))
+
+        if roi_tracking:
+            self.roi = RoiTracker(
+                scale=rf.check("roi_scale") and rf.find("roi_scale").asFloat64() or 6.0,
+                min_size=rf.check("roi_min_size") and rf.find("roi_min_size").asInt32() or 128,
+                max_misses=rf.check("roi_max_misses") and rf.find("roi_max_misses").asInt32() or 3)
+
+        if multi_face:
+            self.tracker = FaceTracker(
+                gate=rf.check("track_gate", yarp.Value(80.0)).asFloat64(),
+                max_misses=rf.check("track_max_misses", yarp.Value(5)).asInt32())
+            if self.roi is not None:
+                self.logs.warning("[%s] ROI tracking is disabled in multi-face mode." % self.getName())
+                self.roi = None
+
+        if rf.check("motion_gating") and rf.find("motion_gating").asBool():
+            self.gate = MotionGate(
+                threshold=rf.check("motion_threshold", yarp.Value(4.0)).asFloat64(),
+                max_backoff=rf.check("max_backoff", yarp.Value(3.2)).asFloat64())
+
+        # Frames are exposed in RGB, which is what the detector backends expect
+        buffers = LatestFrameSlot.N_BUFFERS if self.pipelined else 1
+        self.frames = YarpFrameAdapter(order="rgb", buffers=buffers)
 
         self.input_port.open("/%s/image:i" % self.getName())
         self.output_port.open("/%s/eyes:o" % self.getName())
+        if self.tracker is not None:
+            self.faces_port.open("/%s/faces:o" % self.getName())
+        self.metrics_port.open("/%s/metrics:o" % self.getName())
         self.rpc_port.open("/%s/rpc:o" % self.getName())
         self.cmd_port.open("/%s/cmd:rpc" % self.getName())
 
         self.attach(self.cmd_port)  # connect respond() to RPC input
+
+        if self.display:
+            self.debug = DebugPublisher("/%s/debug:o" % self.getName(), rate=self.display_rate)
+            if not self.debug.open():
+                self.logs.error("[%s] Failed to open debug image port." % self.getName())
+                return False
+
+        if self.pipelined:
+            self.pipeline = FramePipeline(self.input_port, self.frames, self._process_pipelined,
+                                          self.logs, name=self.getName(), timers=self.timers)
+            self.pipeline.start()
+            self.logs.info("[%s] Pipelined capture/inference started." % self.getName())
         return True
 
     def getName(self):
@@ -82,56 +166,143 @@ class iFaceDetector(yarp.RFModule):
         return self.period
 
     def updateModule(self):
+        self.publish_metrics()
+        if self.pipeline is not None:
+            return self._update_pipelined()
+
+        start = time.perf_counter()
         yarp_image = self.input_port.read()
         if yarp_image is None:
             return True
+        acquired = time.perf_counter()
 
-        h, w = yarp_image.height(), yarp_image.width()
-        img = np.zeros((h, w, 3), dtype=np.uint8)
-
-        for y in range(h):
-            for x in range(w):
-                pixel = yarp_image.pixel(x, y)
-                img[y, x, 0] = pixel.b
-                img[y, x, 1] = pixel.g
-                img[y, x, 2] = pixel.r
-
-        rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        results = self.pose.process(rgb)
-
-        visibility_criteria = 0.5
-        keypoints = [2, 5] # keypoints = [left_eye, right_eye]
-
-        if results.pose_landmarks:
-            lm = results.pose_landmarks.landmark
-            if all(lm[i].visibility > visibility_criteria for i in keypoints):
-                u, v, _ = self.find_eye_midpoint(lm, keypoints)
-                cx, cy = int(u * w), int(v * h)
-
-                if 0 <= cx < w and 0 <= cy < h:
-                    # Send 2D midpoint
-                    bottle = self.output_port.prepare()
-                    bottle.clear()
-                    bottle.addInt32(cx)
-                    bottle.addInt32(cy)
-                    self.output_port.write()
-
-                    if self.display:
-                        cv2.circle(img, (cx, cy), 5, (0, 0, 255), -1)
-                else:
-                    self.logs.warning("[%s] Midpoint out of bounds." % self.getName())
-            else:
-                self.logs.warning("[%s] Eyes not visible." % self.getName())
-        else:
-            self.logs.warning("[%s] No landmarks detected." % self.getName())
-
-        if self.display:
-            cv2.imshow("%s" % self.getName(), img)
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                return False
+        stamp = source_stamp(self.input_port)
+        rgb = self.frames.convert(yarp_image)
+        self.timers.add("acquire", acquired - start)
+        self.timers.add("convert", time.perf_counter() - acquired)
+        self.process_frame(rgb, stamp)
+        return True
 
+    def publish_metrics(self):
+        """Write the stage statistics on metrics:o every metrics_period seconds."""
+        now = time.time()
+        if self.metrics_period <= 0 or now - self._last_metrics < self.metrics_period:
+            return
+        self._last_metrics = now
+        bottle = self.metrics_port.prepare()
+        bottle.clear()
+        self.timers.fill(bottle)
+        self.metrics_port.write()
+
+    def _update_pipelined(self):
+        now = time.time()
+        if now - self._last_stats_log >= self.stats_period:
+            self._last_stats_log = now
+            s = self.pipeline.summary()
+            self.logs.info("[%s] captured=%d processed=%d dropped=%d age=%.1f/%.1f ms (mean/max) fps=%.1f"
+                           % (self.getName(), s["captured"], s["processed"], s["dropped"],
+                              s["age_mean_ms"], s["age_max_ms"], s["fps"]))
         return True
 
+    def _process_pipelined(self, frame):
+        self.process_frame(frame.image, frame.stamp)
+
+    def process_frame(self, rgb, stamp=None):
+        """
+        Detect the eye midpoint in an RGB frame, publish it on eyes:o and return it.
+
+        `stamp` is the envelope of the source image; it is forwarded on every output
+        so that consumers can measure how old a detection is.
+        """
+        if stamp is None:
+            stamp = yarp.Stamp()
+            stamp.update()
+        self.profiler.begin()
+        start = time.perf_counter()
+        self._detected_at = None
+        try:
+            return self._process_frame(rgb, stamp)
+        finally:
+            end = time.perf_counter()
+            if self._detected_at is not None:
+                self.timers.add("output", end - self._detected_at)
+            self.timers.add("process", end - start)
+            self.profiler.end()
+
+    def _process_frame(self, rgb, stamp):
+        h, w = rgb.shape[:2]
+
+        # Skip inference on static frames, and back off while nobody is in view
+        if self.gate is not None:
+            start = time.perf_counter()
+            process = self.gate.should_process(rgb)
+            self.timers.add("gate", time.perf_counter() - start)
+            if not process:
+                return None
+
+        # In ROI tracking mode, run inference on a crop around the last midpoint
+        box = self.roi.crop_box(w, h) if self.roi is not None else None
+        start = time.perf_counter()
+        if box is None:
+            x0, y0 = 0, 0
+            detections = self.detector.detect(rgb)
+        else:
+            x0, y0, x1, y1 = box
+            detections = self.detector.detect(np.ascontiguousarray(rgb[y0:y1, x0:x1]))
+        self._detected_at = time.perf_counter()
+        self.timers.add("detect", self._detected_at - start)
+
+        # Map detections back to full-frame pixels
+        detections = [d._replace(u=x0 + d.u, v=y0 + d.v) for d in detections
+                      if 0 <= x0 + d.u < w and 0 <= y0 + d.v < h]
+
+        if self.tracker is not None:
+            self.tracker.update(detections)
+            self.publish_faces(self.tracker.visible(), stamp)
+            target = self.tracker.primary()
+        else:
+            target = detections[0] if detections else None
+
+        if self.gate is not None:
+            self.gate.on_result(target is not None)
+
+        if target is None:
+            if self.debug is not None:
+                self.debug.submit(rgb)
+            self.logs.warning("[%s] No eyes detected." % self.getName())
+            if self.roi is not None:
+                self.roi.miss()
+            return None
+
+        cx, cy = int(target.u), int(target.v)
+        if self.roi is not None:
+            self.roi.hit((cx, cy), target.eye_distance)
+        if self.debug is not None:
+            self.debug.submit(rgb, (cx, cy), self.tracker.visible() if self.tracker is not None else ())
+
+        # Send 2D midpoint
+        bottle = self.output_port.prepare()
+        bottle.clear()
+        bottle.addInt32(cx)
+        bottle.addInt32(cy)
+        self.output_port.setEnvelope(stamp)
+        self.output_port.write()
+        return cx, cy
+
+    def publish_faces(self, tracks, stamp):
+        """Write all visible faces as ((id u v score age) ...) in one bottle, empty if none."""
+        bottle = self.faces_port.prepare()
+        bottle.clear()
+        for track in tracks:
+            face = bottle.addList()
+            face.addInt32(track.id)
+            face.addInt32(int(track.u))
+            face.addInt32(int(track.v))
+            face.addFloat64(track.score)
+            face.addInt32(track.age)
+        self.faces_port.setEnvelope(stamp)
+        self.faces_port.write()
+
     def respond(self, command, reply):
         self.logs.info(f"%s Received command: {command.toString()}" % self.getName())
 
@@ -139,6 +310,46 @@ class iFaceDetector(yarp.RFModule):
             self.period = command.find("period").asFloat64()
             reply.addString("ack")
             return True
+        elif command.get(0).asString() == "stats":
+            # Reply: one (stage count mean p50 p95 p99 max) list per stage, times in ms
+            self.timers.fill(reply)
+            return True
+        elif command.get(0).asString() == "profile":
+            # profile start [every N] | profile stop [file.prof] | profile
+            action = command.get(1).asString()
+            if action == "start":
+                every = command.get(2).asInt32() if command.size() > 2 else 1
+                self.profiler.start(every)
+                reply.addString("ack")
+            elif action == "stop":
+                path = command.get(2).asString() if command.size() > 2 else "%s.prof" % self.getName()
+                if self.profiler.stop(path):
+                    reply.addString("ack")
+                    reply.addString(path)
+                else:
+                    reply.addString("nack")
+                    reply.addString("profiler not running")
+            else:
+                running, frames, profiled, pid = self.profiler.status()
+                reply.addString("running" if running else "stopped")
+                reply.addInt32(frames)
+                reply.addInt32(profiled)
+                reply.addInt32(pid)
+            return True
+        elif command.get(0).asString() == "gate":
+            # Reply: (frames N) (processed N) (skipped N) (motion N) (backoff s)
+            if self.gate is None:
+                reply.addString("nack")
+                reply.addString("motion gating disabled")
+                return True
+            for key, value in self.gate.stats().items():
+                entry = reply.addList()
+                entry.addString(key)
+                if isinstance(value, float):
+                    entry.addFloat64(value)
+                else:
+                    entry.addInt32(value)
+            return True
         elif command.get(0).asVocab() == VOCAB_QUIT:
             reply.addString("bye")
             return False
@@ -147,24 +358,24 @@ class iFaceDetector(yarp.RFModule):
             reply.addString("unknown command")
             return True
 
-    def find_eye_midpoint(self, landmarks, indices):
-        x = np.mean([landmarks[i].x for i in indices])
-        y = np.mean([landmarks[i].y for i in indices])
-        z = np.mean([landmarks[i].z for i in indices])
-        return x, y, z
-
     def interruptModule(self):
         self.logs.info("[%s] Interrupting..." % self.getName())
         return True
 
     def close(self):
         self.logs.info("[%s] Closing ports and cleaning up..." % self.getName())
+        if self.pipeline is not None:
+            self.pipeline.stop()
         self.input_port.close()
         self.output_port.close()
+        self.faces_port.close()
+        self.metrics_port.close()
         self.rpc_port.close()
         self.cmd_port.close()
-        if self.display:
-            cv2.destroyAllWindows()
+        if self.detector is not None:
+            self.detector.close()
+        if self.debug is not None:
+            self.debug.close()
         return True
 
 
@@ -0,0 +1,284 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+from collections import namedtuple
+import cv2
+import numpy as np
+import yarp
+
+# Eye midpoint (u, v) and inter-ocular distance in pixels of the processed image
+Detection = namedtuple("Detection", ["u", "v", "eye_distance", "score"])
+
+
+class DetectorBackend:
+    """
+    Interface of the face/eye detectors used by iFaceDetector.
+
+    `detect(rgb)` takes an (h, w, 3) uint8 RGB frame and returns a list of
+    Detection, best first, in pixel coordinates of that frame.
+    """
+
+    name = "base"
+
+    def detect(self, rgb):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class MediaPipePoseBackend(DetectorBackend):
+    """
+    Full-body MediaPipe Pose, using landmarks 2 and 5 (left/right eye).
+
+    By default Pose tracks the person across frames and smooths the landmarks.
+    With `static`, every frame is processed on its own, for inputs that are not
+    consecutive views of one camera (moving ROI crops, frames of several cameras).
+    """
+
+    name = "pose"
+    KEYPOINTS = (2, 5)
+
+    def __init__(self, model_complexity=1, visibility=0.5, static=False):
+        import mediapipe as mp
+        self.visibility = visibility
+        self.pose = mp.solutions.pose.Pose(static_image_mode=static, model_complexity=model_complexity,
+                                           smooth_landmarks=not static)
+
+    def detect(self, rgb):
+        h, w = rgb.shape[:2]
+        results = self.pose.process(rgb)
+        if not results.pose_landmarks:
+            return []
+
+        lm = results.pose_landmarks.landmark
+        left, right = (lm[i] for i in self.KEYPOINTS)
+        score = min(left.visibility, right.visibility)
+        if score <= self.visibility:
+            return []
+        return [_eyes_to_detection(left.x * w, left.y * h, right.x * w, right.y * h, score)]
+
+    def close(self):
+        self.pose.close()
+
+
+class MediaPipeFaceBackend(DetectorBackend):
+    """MediaPipe face detection (BlazeFace), using its two eye keypoints."""
+
+    name = "face"
+
+    def __init__(self, model_selection=0, min_confidence=0.5):
+        import mediapipe as mp
+        self.face = mp.solutions.face_detection.FaceDetection(model_selection=model_selection,
+                                                              min_detection_confidence=min_confidence)
+
+    def detect(self, rgb):
+        h, w = rgb.shape[:2]
+        results = self.face.process(rgb)
+        if not results.detections:
+            return []
+
+        detections = []
+        for detection in results.detections:
+            right, left = detection.location_data.relative_keypoints[:2]
+            detections.append(_eyes_to_detection(left.x * w, left.y * h, right.x * w, right.y * h,
+                                                 detection.score[0]))
+        return sorted(detections, key=lambda d: d.score, reverse=True)
+
+    def close(self):
+        self.face.close()
+
+
+class YuNetBackend(DetectorBackend):
+    """OpenCV DNN YuNet face detector (cv2.FaceDetectorYN), using its eye landmarks."""
+
+    name = "yunet"
+
+    def __init__(self, model_path="face_detection_yunet_2023mar.onnx", score_threshold=0.6,
+                 nms_threshold=0.3, top_k=50, threads=0):
+        if threads > 0:
+            cv2.setNumThreads(threads)
+        self.detector = cv2.FaceDetectorYN.create(model_path, "", (320, 320), score_threshold,
+                                                  nms_threshold, top_k)
+        self.input_size = (320, 320)
+        self._bgr = None
+
+    def detect(self, rgb):
+        h, w = rgb.shape[:2]
+        if self.input_size != (w, h):
+            self.input_size = (w, h)
+            self.detector.setInputSize(self.input_size)
+        if self._bgr is None or self._bgr.shape != rgb.shape:
+            self._bgr = np.empty_like(rgb)
+        cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=self._bgr)
+
+        _, faces = self.detector.detect(self._bgr)
+        if faces is None:
+            return []
+        # Each row: x, y, w, h, right eye (x, y), left eye (x, y), nose, mouth corners, score
+        detections = [_eyes_to_detection(f[6], f[7], f[4], f[5], f[14]) for f in faces]
+        return sorted(detections, key=lambda d: d.score, reverse=True)
+
+
+class OnnxYuNetBackend(DetectorBackend):
+    """
+    YuNet face detector on ONNX Runtime or OpenVINO (runtime.py), e.g. with INT8 or
+    FP16 weights. Pre- and post-processing follow cv2.FaceDetectorYN, vectorized
+    with NumPy; the session is warmed up in the constructor.
+    """
+
+    name = "onnx"
+    STRIDES = (8, 16, 32)
+
+    def __init__(self, model_path="face_detection_yunet_2023mar_int8.onnx", runtime="onnxruntime", threads=1,
+                 score_threshold=0.6, nms_threshold=0.3, top_k=50, warmup_runs=3, warmup_size=(480, 640)):
+        from runtime import create_session
+        self.session = create_session(runtime, model_path, threads)
+        self.score_threshold = score_threshold
+        self.nms_threshold = nms_threshold
+        self.top_k = top_k
+        self._blob = None
+        self._grids = {}
+        self.warmup_time = self.session.warmup(*_padded(*warmup_size), runs=warmup_runs)
+
+    def _grid(self, in_h, in_w, stride):
+        key = (in_h, in_w, stride)
+        if key not in self._grids:
+            rows, cols = np.mgrid[0:in_h // stride, 0:in_w // stride]
+            self._grids[key] = np.stack([cols.ravel(), rows.ravel()], axis=1).astype(np.float32)
+        return self._grids[key]
+
+    def detect(self, rgb):
+        self._blob, (sx, sy) = yunet_blob(rgb, self.session.input_size, self._blob)
+        in_h, in_w = self._blob.shape[2:]
+        outputs = self.session.run(self._blob)
+
+        boxes, eyes, scores = [], [], []
+        for stride in self.STRIDES:
+            cls = np.clip(outputs["cls_%d" % stride].reshape(-1), 0.0, 1.0)
+            obj = np.clip(outputs["obj_%d" % stride].reshape(-1), 0.0, 1.0)
+            score = np.sqrt(cls * obj)
+            keep = score > self.score_threshold
+            if not keep.any():
+                continue
+            grid = self._grid(in_h, in_w, stride)[keep]
+            bbox = outputs["bbox_%d" % stride].reshape(-1, 4)[keep]
+            kps = outputs["kps_%d" % stride].reshape(-1, 10)[keep]
+
+            sizes = np.exp(bbox[:, 2:]) * stride
+            boxes.append(np.hstack([(grid + bbox[:, :2]) * stride - sizes / 2, sizes]))
+            # Keypoints: right eye, left eye, nose, mouth corners; only the eyes are kept
+            eyes.append((kps[:, :4] + np.tile(grid, 2)) * stride)
+            scores.append(score[keep])
+
+        if not scores:
+            return []
+        boxes, eyes, scores = np.vstack(boxes), np.vstack(eyes), np.concatenate(scores)
+        keep = cv2.dnn.NMSBoxes(boxes.tolist(), scores.tolist(), self.score_threshold, self.nms_threshold,
+                                top_k=self.top_k)
+
+        detections = []
+        for i in np.array(keep, dtype=int).reshape(-1):
+            right_x, right_y, left_x, left_y = eyes[i]
+            detections.append(_eyes_to_detection(left_x * sx, left_y * sy, right_x * sx, right_y * sy, scores[i]))
+        return sorted(detections, key=lambda d: d.score, reverse=True)
+
+
+BACKENDS = {
+    MediaPipePoseBackend.name: MediaPipePoseBackend,
+    MediaPipeFaceBackend.name: MediaPipeFaceBackend,
+    YuNetBackend.name: YuNetBackend,
+    OnnxYuNetBackend.name: OnnxYuNetBackend,
+}
+
+
+def create_backend(name, **options):
+    if name not in BACKENDS:
+        raise ValueError("Unknown detector backend '%s' (available: %s)" % (name, ", ".join(BACKENDS)))
+    return BACKENDS[name](**options)
+
+
+def backend_options(rf, name, static=False):
+    """
+    Collect the constructor options of backend `name` from a yarp.ResourceFinder.
+    With `static`, stateful backends process each frame on its own.
+    """
+    if name == MediaPipePoseBackend.name:
+        return {"model_complexity": rf.check("pose_complexity", yarp.Value(1)).asInt32(), "static": static}
+    if name == MediaPipeFaceBackend.name:
+        return {"model_selection": rf.check("face_model", yarp.Value(0)).asInt32()}
+    if name == YuNetBackend.name:
+        return {"model_path": rf.check("yunet_model", yarp.Value("face_detection_yunet_2023mar.onnx")).asString()}
+    if name == OnnxYuNetBackend.name:
+        return {"model_path": rf.check("onnx_model", yarp.Value("face_detection_yunet_2023mar_int8.onnx")).asString(),
+                "runtime": rf.check("onnx_runtime", yarp.Value("onnxruntime")).asString(),
+                "threads": rf.check("onnx_threads", yarp.Value(1)).asInt32(),
+                "warmup_runs": rf.check("onnx_warmup", yarp.Value(3)).asInt32()}
+    return {}
+
+
+def yunet_blob(rgb, input_size=None, blob=None):
+    """
+    Build the YuNet input (1, 3, H, W) float32 planar BGR blob from an RGB frame.
+
+    Frames are resized to a static model `input_size` (height, width), or zero-padded
+    to a multiple of 32 when the model is dynamic. `blob` is reused when its shape
+    matches. Returns the blob and the (x, y) scale back to frame pixels.
+    """
+    h, w = rgb.shape[:2]
+    if input_size is not None:
+        in_h, in_w = input_size
+        scale = (w / float(in_w), h / float(in_h))
+        image = cv2.resize(rgb, (in_w, in_h))
+    else:
+        in_h, in_w = _padded(h, w)
+        scale = (1.0, 1.0)
+        image = rgb
+
+    if blob is None or blob.shape[2:] != (in_h, in_w):
+        blob = np.zeros((1, 3, in_h, in_w), dtype=np.float32)
+    ih, iw = image.shape[:2]
+    for channel in range(3):
+        blob[0, channel, :ih, :iw] = image[:, :, 2 - channel]
+    return blob, scale
+
+
+def _padded(height, width):
+    return ((height - 1) // 32 + 1) * 32, ((width - 1) // 32 + 1) * 32
+
+
+def _eyes_to_detection(left_x, left_y, right_x, right_y, score):
+    return Detection(u=float(left_x + right_x) / 2.0, v=float(left_y + right_y) / 2.0,
+                     eye_distance=float(np.hypot(left_x - right_x, left_y - right_y)), score=float(score))
@@ -0,0 +1,183 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import cv2
+import numpy as np
+from backends import create_backend
+from recording import FrameRecorder, FrameRecording
+from roi import RoiTracker
+
+
+def load_frames(source, max_frames):
+    """Load RGB frames from a recording (record.py), a video file or a folder of images."""
+    frames = []
+    if source.endswith(FrameRecorder.EXTENSION):
+        recording = FrameRecording(source)
+        frames = [np.array(recording.image(i)) for i in range(min(len(recording), max_frames))]
+    elif os.path.isdir(source):
+        for path in sorted(glob.glob(os.path.join(source, "*"))):
+            bgr = cv2.imread(path)
+            if bgr is not None:
+                frames.append(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
+            if len(frames) >= max_frames:
+                break
+    else:
+        capture = cv2.VideoCapture(source)
+        while len(frames) < max_frames:
+            ok, bgr = capture.read()
+            if not ok:
+                break
+            frames.append(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
+        capture.release()
+    return frames
+
+
+def make_backend(spec, args, static=False):
+    name, _, arg = spec.partition(":")
+    if name == "pose":
+        return create_backend(name, model_complexity=int(arg or 1), static=static)
+    if name == "face":
+        return create_backend(name, model_selection=int(arg or 0))
+    if name == "yunet":
+        return create_backend(name, model_path=arg or args.yunet_model)
+    if name == "onnx":
+        return create_backend(name, model_path=args.onnx_model, runtime=arg or "onnxruntime",
+                              threads=args.onnx_threads)
+    return create_backend(name)
+
+
+def run(backend, frames):
+    backend.detect(frames[0])  # warm-up, not timed
+    latencies, midpoints = [], []
+    for rgb in frames:
+        start = time.perf_counter()
+        detections = backend.detect(rgb)
+        latencies.append(time.perf_counter() - start)
+        midpoints.append((detections[0].u, detections[0].v) if detections else None)
+    return np.array(latencies) * 1e3, midpoints
+
+
+def run_roi(backend, frames, roi):
+    """Like run(), on crops around the last midpoint as iFaceDetector does with --roi_tracking."""
+    backend.detect(frames[0])  # warm-up, not timed
+    latencies, midpoints = [], []
+    for rgb in frames:
+        h, w = rgb.shape[:2]
+        box = roi.crop_box(w, h)
+        x0, y0 = (0, 0) if box is None else box[:2]
+        start = time.perf_counter()
+        crop = rgb if box is None else np.ascontiguousarray(rgb[box[1]:box[3], box[0]:box[2]])
+        detections = backend.detect(crop)
+        latencies.append(time.perf_counter() - start)
+        if detections:
+            d = detections[0]
+            midpoints.append((x0 + d.u, y0 + d.v))
+            roi.hit((int(x0 + d.u), int(y0 + d.v)), d.eye_distance)
+        else:
+            midpoints.append(None)
+            roi.miss()
+    return np.array(latencies) * 1e3, midpoints
+
+
+def agreement(midpoints, baseline):
+    both = [(m, b) for m, b in zip(midpoints, baseline) if m is not None and b is not None]
+    same = sum((m is None) == (b is None) for m, b in zip(midpoints, baseline))
+    errors = np.array([np.hypot(m[0] - b[0], m[1] - b[1]) for m, b in both])
+    if errors.size == 0:
+        return same / len(baseline), float("nan"), float("nan")
+    return same / len(baseline), np.median(errors), np.percentile(errors, 95)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU benchmark of the iFaceDetector backends")
+    parser.add_argument("--input", required=True, help="recording, video file or folder of images")
+    parser.add_argument("--backends", nargs="+", default=["pose:0", "pose:1", "pose:2", "face:0", "face:1", "yunet"],
+                        help="backend specs, e.g. pose:<complexity>, face:<model>, yunet[:<model.onnx>], "
+                             "onnx:<onnxruntime|openvino>")
+    parser.add_argument("--baseline", default="pose:1", help="backend spec used as reference")
+    parser.add_argument("--yunet-model", default="face_detection_yunet_2023mar.onnx")
+    parser.add_argument("--onnx-model", default="face_detection_yunet_2023mar_int8.onnx")
+    parser.add_argument("--onnx-threads", type=int, default=1)
+    parser.add_argument("--max-frames", type=int, default=300)
+    parser.add_argument("--roi", action="store_true",
+                        help="also run each backend in ROI tracking mode (reported as <spec>+roi)")
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="fail if a backend's median midpoint error exceeds this many pixels")
+    parser.add_argument("--min-agreement", type=float, default=0.0,
+                        help="fail if a backend agrees on face presence in less than this share of frames")
+    args = parser.parse_args()
+
+    frames = load_frames(args.input, args.max_frames)
+    if not frames:
+        raise SystemExit("No frames loaded from %s" % args.input)
+    h, w = frames[0].shape[:2]
+    print("%d frames, %dx%d, baseline %s" % (len(frames), w, h, args.baseline))
+
+    results = {}
+    for spec in [args.baseline] + [b for b in args.backends if b != args.baseline]:
+        backend = make_backend(spec, args)
+        results[spec] = run(backend, frames)
+        backend.close()
+        if args.roi:
+            # Static mode, as in iFaceDetector: the crops are not consecutive views
+            backend = make_backend(spec, args, static=True)
+            results[spec + "+roi"] = run_roi(backend, frames, RoiTracker())
+            backend.close()
+
+    baseline = results[args.baseline][1]
+    failed = []
+    print("%-14s %8s %8s %8s %8s %8s %8s %10s %10s" % ("backend", "fps", "p50[ms]", "p95[ms]", "p99[ms]",
+                                                       "det[%]", "agree[%]", "err50[px]", "err95[px]"))
+    for spec, (latencies, midpoints) in results.items():
+        detected = 100.0 * sum(m is not None for m in midpoints) / len(midpoints)
+        agree, err50, err95 = agreement(midpoints, baseline)
+        print("%-14s %8.1f %8.2f %8.2f %8.2f %8.1f %8.1f %10.1f %10.1f" % (
+            spec, 1e3 / latencies.mean(), np.percentile(latencies, 50), np.percentile(latencies, 95),
+            np.percentile(latencies, 99), detected, 100.0 * agree, err50, err95))
+        if agree < args.min_agreement or (args.tolerance is not None and not err50 <= args.tolerance):
+            failed.append(spec)
+
+    if failed:
+        print("Outside tolerance: %s" % ", ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
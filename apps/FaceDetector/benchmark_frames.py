@@ -0,0 +1,102 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import argparse
+import time
+import numpy as np
+import yarp
+from frames import YarpFrameAdapter
+
+RESOLUTIONS = [(320, 240), (640, 480), (1024, 768)]
+
+
+def make_yarp_image(width, height):
+    array = np.random.randint(0, 256, (height, width, 3), dtype=np.uint8)
+    source = yarp.ImageRgb()
+    source.resize(width, height)
+    source.setExternal(array.data, width, height)
+    image = yarp.ImageRgb()
+    image.copy(source)
+    return image
+
+
+def legacy_convert(yarp_image):
+    h, w = yarp_image.height(), yarp_image.width()
+    img = np.zeros((h, w, 3), dtype=np.uint8)
+    for y in range(h):
+        for x in range(w):
+            pixel = yarp_image.pixel(x, y)
+            img[y, x, 0] = pixel.b
+            img[y, x, 1] = pixel.g
+            img[y, x, 2] = pixel.r
+    return img
+
+
+def time_per_frame(convert, image, repeats):
+    convert(image)  # allocate buffers outside the timed loop
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        convert(image)
+        samples.append(time.perf_counter() - start)
+    samples = np.array(samples) * 1e3
+    return np.median(samples), np.percentile(samples, 95)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-frame YARP image to NumPy conversion cost")
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--legacy-repeats", type=int, default=2,
+                        help="repeats for the per-pixel loop (0 to skip)")
+    args = parser.parse_args()
+
+    rgb = YarpFrameAdapter(order="rgb")
+    bgr = YarpFrameAdapter(order="bgr")
+
+    print("%-10s %-16s %10s %10s" % ("size", "method", "p50 [ms]", "p95 [ms]"))
+    for width, height in RESOLUTIONS:
+        image = make_yarp_image(width, height)
+        size = "%dx%d" % (width, height)
+        if args.legacy_repeats > 0:
+            p50, p95 = time_per_frame(legacy_convert, image, args.legacy_repeats)
+            print("%-10s %-16s %10.3f %10.3f" % (size, "pixel loop", p50, p95))
+        p50, p95 = time_per_frame(rgb.convert, image, args.repeats)
+        print("%-10s %-16s %10.3f %10.3f" % (size, "adapter (rgb)", p50, p95))
+        p50, p95 = time_per_frame(bgr.convert, image, args.repeats)
+        print("%-10s %-16s %10.3f %10.3f" % (size, "adapter (bgr)", p50, p95))
+
+
+if __name__ == "__main__":
+    main()
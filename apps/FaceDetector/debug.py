@@ -0,0 +1,136 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import os
+import threading
+import time
+import cv2
+import numpy as np
+import yarp
+
+
+class DebugPublisher:
+    """
+    Publish annotated frames on a yarp.Port from a background, low-priority thread.
+
+    `submit()` never blocks the caller: at most `rate` frames per second are
+    copied into the publisher's own buffer (later frames replace pending ones),
+    and drawing and writing happen on the publisher thread. The yarp image is
+    backed by that NumPy buffer through setExternal(), so it is written as is.
+    """
+
+    def __init__(self, port_name, rate=5.0, niceness=10):
+        self.port_name = port_name
+        self.min_interval = 1.0 / rate if rate > 0 else 0.0
+        self.niceness = niceness
+        self.port = yarp.Port()
+        self.published = 0
+        self._buffer = None
+        self._image = None
+        self._pending = None
+        self._last_submit = 0.0
+        self._busy = False
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def open(self):
+        if not self.port.open(self.port_name):
+            return False
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="debug-publisher", daemon=True)
+        self._thread.start()
+        return True
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self.port.close()
+
+    def submit(self, rgb, midpoint=None, tracks=()):
+        now = time.monotonic()
+        if now - self._last_submit < self.min_interval or self.port.getOutputCount() == 0:
+            return
+        with self._cond:
+            if self._busy:
+                return
+            if self._buffer is None or self._buffer.shape != rgb.shape:
+                self._allocate(rgb.shape)
+            np.copyto(self._buffer, rgb)
+            self._pending = (midpoint, list(tracks))
+            self._last_submit = now
+            self._cond.notify()
+
+    def _allocate(self, shape):
+        height, width = shape[:2]
+        self._buffer = np.empty(shape, dtype=np.uint8)
+        self._image = yarp.ImageRgb()
+        self._image.resize(width, height)
+        self._image.setExternal(self._buffer.data, width, height)
+
+    def _run(self):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.niceness)
+        except (AttributeError, OSError):
+            pass
+
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or not self._running)
+                if not self._running:
+                    return
+                midpoint, tracks = self._pending
+                self._pending = None
+                self._busy = True
+            try:
+                self._draw(midpoint, tracks)
+                self.port.write(self._image)
+                self.published += 1
+            finally:
+                with self._cond:
+                    self._busy = False
+
+    def _draw(self, midpoint, tracks):
+        # The buffer is RGB, so colors are (r, g, b)
+        for track in tracks:
+            center = (int(track.u), int(track.v))
+            cv2.circle(self._buffer, center, 5, (0, 255, 0), -1)
+            cv2.putText(self._buffer, str(track.id), (center[0] + 8, center[1] - 8),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+        if midpoint is not None:
+            cv2.circle(self._buffer, midpoint, 5, (255, 0, 0), -1)
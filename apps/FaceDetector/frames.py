@@ -0,0 +1,109 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import cv2
+import numpy as np
+import yarp
+
+
+class YarpFrameAdapter:
+    """
+    Expose incoming yarp.ImageRgb frames as NumPy arrays.
+
+    Each frame is copied once, in C++, into a preallocated (h, w, 3) uint8 array
+    that backs a yarp.ImageRgb through setExternal(). Buffers are reallocated
+    only when the input resolution changes.
+    """
+
+    def __init__(self, order="rgb", buffers=1, allocator=None):
+        if order not in ("rgb", "bgr"):
+            raise ValueError("Unknown channel order '%s'" % order)
+        if buffers < 1:
+            raise ValueError("At least one buffer is required")
+        self.order = order
+        self.n_buffers = buffers
+        # allocator(shape) -> uint8 array, e.g. backed by shared memory
+        self.allocator = allocator
+        self.width = 0
+        self.height = 0
+        self.resizes = 0
+        self._buffers = []
+        self._index = 0
+
+    def _allocate(self, width, height):
+        self._buffers = []
+        for _ in range(self.n_buffers):
+            if self.allocator is not None:
+                array = self.allocator((height, width, 3))
+            else:
+                array = np.zeros((height, width, 3), dtype=np.uint8)
+            image = yarp.ImageRgb()
+            image.resize(width, height)
+            image.setExternal(array.data, width, height)
+            self._buffers.append((array, image))
+        self._index = 0
+        self.width = width
+        self.height = height
+        self.resizes += 1
+
+    def convert(self, yarp_image, index=None):
+        """
+        Return the frame as an (h, w, 3) array in the configured channel order.
+
+        Buffers are used round-robin unless `index` selects one explicitly, which
+        lets a caller (e.g. LatestFrameSlot) decide which buffer is safe to overwrite.
+        """
+        width, height = yarp_image.width(), yarp_image.height()
+        if width != self.width or height != self.height:
+            self._allocate(width, height)
+
+        if index is None:
+            index = self._index
+            self._index = (self._index + 1) % self.n_buffers
+        array, external = self._buffers[index]
+
+        external.copy(yarp_image)
+        if self.order == "bgr":
+            cv2.cvtColor(array, cv2.COLOR_RGB2BGR, dst=array)
+        return array
+
+
+def source_stamp(port):
+    """Envelope of the last message read from `port`, or a local timestamp if the sender set none."""
+    stamp = yarp.Stamp()
+    port.getEnvelope(stamp)
+    if not stamp.isValid():
+        stamp.update()
+    return stamp
@@ -0,0 +1,99 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import time
+import cv2
+
+
+class MotionGate:
+    """
+    Decide whether a frame is worth running the detector on.
+
+    Frames are shrunk to `size` grayscale thumbnails and compared, by mean
+    absolute difference, with the thumbnail of the last processed frame. Motion
+    above `threshold` grey levels always triggers inference. Otherwise inference
+    runs at most every `interval` seconds: zero while a face is visible, doubling
+    from `min_backoff` up to `max_backoff` after each inference that found nobody.
+    """
+
+    def __init__(self, threshold=4.0, size=(64, 48), min_backoff=0.2, max_backoff=3.2):
+        self.threshold = threshold
+        self.size = size
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.interval = 0.0
+        self._reference = None
+        self._last_inference = 0.0
+        self.frames = 0
+        self.processed = 0
+        self.skipped = 0
+        self.motion_events = 0
+
+    def _thumbnail(self, rgb):
+        small = cv2.resize(rgb, self.size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
+
+    def should_process(self, rgb, now=None):
+        now = time.monotonic() if now is None else now
+        self.frames += 1
+        thumbnail = self._thumbnail(rgb)
+
+        motion = self._reference is None or cv2.absdiff(thumbnail, self._reference).mean() > self.threshold
+        if motion:
+            self.motion_events += 1
+            self.interval = 0.0
+        elif now - self._last_inference < self.interval:
+            self.skipped += 1
+            return False
+
+        self._reference = thumbnail
+        self._last_inference = now
+        self.processed += 1
+        return True
+
+    def on_result(self, found):
+        if found:
+            self.interval = 0.0
+        else:
+            self.interval = min(max(2.0 * self.interval, self.min_backoff), self.max_backoff)
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "motion": self.motion_events,
+            "backoff": self.interval,
+        }
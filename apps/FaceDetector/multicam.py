@@ -0,0 +1,295 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import multiprocessing
+import os
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+import yarp
+from pyicub.core.logger import YarpLogger
+from frames import YarpFrameAdapter
+from backends import create_backend, backend_options
+
+VOCAB_QUIT = yarp.createVocab32("q", "u", "i", "t")
+
+# Per-process state of the inference workers
+_backends = {}  # camera -> its own detector, so stateful backends track one camera each
+_segments = {}  # camera -> SharedMemory of its current frame buffer
+
+
+def _init_worker(cameras, backend_name, options):
+    for camera in cameras:
+        _backends[camera] = create_backend(backend_name, **options)
+
+
+def _worker_pid():
+    return os.getpid()
+
+
+def _attach(segment_name):
+    """
+    Map a segment owned (and unlinked) by the module process without tracking it here:
+    a tracked segment is unlinked by this worker's resource tracker when the worker
+    exits, under the module's feet, and reported as leaked.
+    """
+    try:
+        return SharedMemory(name=segment_name, track=False)  # Python >= 3.13
+    except TypeError:
+        segment = SharedMemory(name=segment_name)
+        # Registered under its POSIX name, with the leading slash
+        resource_tracker.unregister("/" + segment_name if os.name == "posix" else segment_name, "shared_memory")
+        return segment
+
+
+def _detect(camera, segment_name, shape):
+    segment = _segments.get(camera)
+    if segment is not None and segment.name != segment_name:
+        # The camera's buffer was reallocated (resolution change): drop the stale mapping
+        segment.close()
+        segment = None
+    if segment is None:
+        segment = _attach(segment_name)
+        _segments[camera] = segment
+    rgb = np.ndarray(shape, dtype=np.uint8, buffer=segment.buf)
+    return [tuple(d) for d in _backends[camera].detect(rgb)]
+
+
+class SharedFrameAllocator:
+    """YarpFrameAdapter allocator returning arrays backed by named shared memory."""
+
+    def __init__(self):
+        self.segment = None
+
+    @property
+    def name(self):
+        return self.segment.name
+
+    def __call__(self, shape):
+        self.release()
+        self.segment = SharedMemory(create=True, size=int(np.prod(shape)))
+        return np.ndarray(shape, dtype=np.uint8, buffer=self.segment.buf)
+
+    def release(self):
+        if self.segment is None:
+            return
+        try:
+            self.segment.close()
+        except BufferError:
+            pass  # still mapped by a stale array, freed with it
+        self.segment.unlink()
+        self.segment = None
+
+
+class Camera:
+    def __init__(self, module_name, name, pool):
+        self.name = name
+        self.pool = pool  # the worker that processes all the frames of this camera
+        self.shared = SharedFrameAllocator()
+        self.frames = YarpFrameAdapter(order="rgb", allocator=self.shared)
+        self.stamp = yarp.Stamp()
+        self.input_port = yarp.BufferedPortImageRgb()
+        self.output_port = yarp.BufferedPortBottle()
+        self.input_port_name = "/%s/%s/image:i" % (module_name, name)
+        self.output_port_name = "/%s/%s/eyes:o" % (module_name, name)
+
+    def open(self):
+        return self.input_port.open(self.input_port_name) and self.output_port.open(self.output_port_name)
+
+    def read(self):
+        """Convert the newest frame, if any, into shared memory and return its shape."""
+        yarp_image = self.input_port.read(False)
+        if yarp_image is None:
+            return None
+        self.input_port.getEnvelope(self.stamp)
+        return self.frames.convert(yarp_image).shape
+
+    def publish(self, detections, shape, stamp):
+        if not detections:
+            return
+        h, w = shape[:2]
+        u, v = detections[0][0], detections[0][1]
+        if not (0 <= u < w and 0 <= v < h):
+            return
+        bottle = self.output_port.prepare()
+        bottle.clear()
+        bottle.addInt32(int(u))
+        bottle.addInt32(int(v))
+        self.output_port.setEnvelope(stamp)
+        self.output_port.write()
+
+    def interrupt(self):
+        self.input_port.interrupt()
+        self.output_port.interrupt()
+
+    def close(self):
+        self.input_port.close()
+        self.output_port.close()
+        self.shared.release()
+
+
+class iMultiCamFaceDetector(yarp.RFModule):
+    """
+    Eye-midpoint detection on N cameras in one module.
+
+    Frames are converted straight into per-camera shared memory and processed by
+    a pool of worker processes, so inference scales across cores instead of
+    contending for the GIL. The frames read in one cycle form a set: their
+    results are published together, with the same envelope on every camera port.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.period = 0.01
+        self.timeout = 5.0
+        self.logs = YarpLogger.getLogger()
+        self.cameras = []
+        self.pools = []
+        self.sets = 0
+        self.cmd_port = yarp.Port()
+
+    def configure(self, rf):
+        self.logs.info("[%s] Configuring module..." % self.getName())
+        self.period = rf.check("period", yarp.Value(0.01)).asFloat64()
+        self.timeout = rf.check("timeout", yarp.Value(5.0)).asFloat64()
+
+        names = ["left", "right"]
+        if rf.check("cameras"):
+            cameras = rf.find("cameras").asList()
+            names = [cameras.get(i).asString() for i in range(cameras.size())]
+        workers = max(1, min(rf.check("workers", yarp.Value(len(names))).asInt32(), len(names)))
+
+        backend_name = rf.check("backend", yarp.Value("pose")).asString()
+        options = backend_options(rf, backend_name)
+        # Each camera always goes to the same worker, which keeps a detector per camera:
+        # a tracking backend (e.g. pose) only ever sees consecutive frames of one camera
+        assigned = [names[i::workers] for i in range(workers)]
+        try:
+            # Workers are spawned, not forked, so they do not inherit YARP/MediaPipe threads
+            context = multiprocessing.get_context("spawn")
+            for cameras in assigned:
+                self.pools.append(context.Pool(1, initializer=_init_worker,
+                                               initargs=(cameras, backend_name, options)))
+            # Workers only take tasks once their models are loaded: wait until all have answered
+            for pool in self.pools:
+                pool.apply_async(_worker_pid).get(timeout=60.0)
+        except Exception as e:
+            self.logs.error("[%s] Failed to start '%s' workers: %s" % (self.getName(), backend_name, str(e)))
+            return False
+
+        for i, name in enumerate(names):
+            camera = Camera(self.getName(), name, self.pools[i % workers])
+            if not camera.open():
+                self.logs.error("[%s] Failed to open ports of camera '%s'." % (self.getName(), name))
+                return False
+            self.cameras.append(camera)
+
+        self.cmd_port.open("/%s/cmd:rpc" % self.getName())
+        self.attach(self.cmd_port)
+        self.logs.info("[%s] %d cameras, %d '%s' workers." % (self.getName(), len(self.cameras), workers, backend_name))
+        return True
+
+    def getName(self):
+        return self.__class__.__name__
+
+    def getPeriod(self):
+        return self.period
+
+    def updateModule(self):
+        jobs = []
+        for camera in self.cameras:
+            shape = camera.read()
+            if shape is not None:
+                jobs.append((camera, shape, camera.pool.apply_async(_detect, (camera.name, camera.shared.name, shape))))
+        if not jobs:
+            return True
+
+        # One envelope for the whole set, timed at the earliest source frame
+        self.sets += 1
+        times = [camera.stamp.getTime() for camera, _, _ in jobs if camera.stamp.isValid()]
+        stamp = yarp.Stamp(self.sets, min(times) if times else yarp.now())
+
+        for camera, shape, job in jobs:
+            try:
+                detections = job.get(timeout=self.timeout)
+            except Exception as e:
+                self.logs.error("[%s] Inference on camera '%s' failed: %s" % (self.getName(), camera.name, str(e)))
+                continue
+            camera.publish(detections, shape, stamp)
+        return True
+
+    def respond(self, command, reply):
+        self.logs.info("[%s] Received command: %s" % (self.getName(), command.toString()))
+
+        if command.check("period"):
+            self.period = command.find("period").asFloat64()
+            reply.addString("ack")
+            return True
+        elif command.get(0).asVocab() == VOCAB_QUIT:
+            reply.addString("bye")
+            return False
+        else:
+            reply.addString("nack")
+            reply.addString("unknown command")
+            return True
+
+    def interruptModule(self):
+        self.logs.info("[%s] Interrupting..." % self.getName())
+        for camera in self.cameras:
+            camera.interrupt()
+        return True
+
+    def close(self):
+        self.logs.info("[%s] Closing ports and cleaning up..." % self.getName())
+        for pool in self.pools:
+            pool.terminate()
+            pool.join()
+        for camera in self.cameras:
+            camera.close()
+        self.cmd_port.close()
+        return True
+
+
+if __name__ == "__main__":
+    yarp.Network.init()
+    rf = yarp.ResourceFinder()
+    rf.setVerbose(True)
+    rf.setDefaultContext("iMultiCamFaceDetector")
+    rf.setDefaultConfigFile("config.ini")
+    rf.configure(sys.argv)
+
+    module = iMultiCamFaceDetector()
+    module.runModule(rf)
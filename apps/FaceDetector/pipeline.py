@@ -0,0 +1,199 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import threading
+import time
+from collections import deque, namedtuple
+from frames import source_stamp
+
+# `stamp` is the yarp.Stamp envelope of the source image
+Frame = namedtuple("Frame", ["image", "sequence", "arrival", "stamp"])
+
+
+class LatestFrameSlot:
+    """
+    Triple-buffered, latest-frame-wins hand-off between one producer and one consumer.
+
+    The producer writes into buffer `back` and publishes it; publishing before the
+    consumer took the previous frame replaces that frame, which is counted as
+    dropped. Buffers are exchanged by index, so image data is never copied.
+    """
+
+    N_BUFFERS = 3
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.back, self._middle, self._front = 0, 1, 2
+        self._frame = None
+        self._closed = False
+        self.dropped = 0
+
+    def publish(self, frame):
+        with self._cond:
+            if self._frame is not None:
+                self.dropped += 1
+            self.back, self._middle = self._middle, self.back
+            self._frame = frame
+            self._cond.notify()
+
+    def take(self, timeout=None):
+        """Return the newest Frame, or None on timeout or after close()."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._frame is not None or self._closed, timeout)
+            if self._frame is None:
+                return None
+            self._front, self._middle = self._middle, self._front
+            frame, self._frame = self._frame, None
+            return frame
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class PipelineStats:
+    """Counters for the capture/inference pipeline, averaged over the last `window` frames."""
+
+    def __init__(self, window=100):
+        self._lock = threading.Lock()
+        self.captured = 0
+        self.processed = 0
+        self._ages = deque(maxlen=window)
+        self._done = deque(maxlen=window)
+
+    def on_capture(self):
+        with self._lock:
+            self.captured += 1
+
+    def on_processed(self, age, now):
+        with self._lock:
+            self.processed += 1
+            self._ages.append(age)
+            self._done.append(now)
+
+    def summary(self, dropped=0):
+        with self._lock:
+            ages = list(self._ages)
+            done = list(self._done)
+            captured, processed = self.captured, self.processed
+        fps = 0.0
+        if len(done) > 1 and done[-1] > done[0]:
+            fps = (len(done) - 1) / (done[-1] - done[0])
+        return {
+            "captured": captured,
+            "processed": processed,
+            "dropped": dropped,
+            "age_mean_ms": 1e3 * sum(ages) / len(ages) if ages else 0.0,
+            "age_max_ms": 1e3 * max(ages) if ages else 0.0,
+            "fps": fps,
+        }
+
+
+class FramePipeline:
+    """
+    Run capture and inference on two threads linked by a LatestFrameSlot.
+
+    The capture thread blocks on `input_port.read()` and converts each image into
+    the slot's back buffer; the inference thread calls `process(frame)` on the
+    newest frame only, so queued frames never delay the output.
+    """
+
+    def __init__(self, input_port, adapter, process, logs, name="pipeline", timers=None):
+        if adapter.n_buffers < LatestFrameSlot.N_BUFFERS:
+            raise ValueError("FramePipeline needs an adapter with %d buffers" % LatestFrameSlot.N_BUFFERS)
+        self.input_port = input_port
+        self.adapter = adapter
+        self.process = process
+        self.logs = logs
+        self.name = name
+        self.slot = LatestFrameSlot()
+        self.stats = PipelineStats()
+        # Optional StageStats receiving "acquire", "convert" and "age" samples
+        self.timers = timers
+        self._running = False
+        self._threads = []
+
+    def start(self):
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="%s-capture" % self.name, daemon=True),
+            threading.Thread(target=self._inference_loop, name="%s-inference" % self.name, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        self._running = False
+        self.input_port.interrupt()
+        self.slot.close()
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+        self._threads = []
+
+    def summary(self):
+        return self.stats.summary(dropped=self.slot.dropped)
+
+    def _capture_loop(self):
+        sequence = 0
+        while self._running:
+            start = time.perf_counter()
+            yarp_image = self.input_port.read(True)
+            if yarp_image is None:
+                continue
+            acquired = time.perf_counter()
+            stamp = source_stamp(self.input_port)
+            image = self.adapter.convert(yarp_image, index=self.slot.back)
+            converted = time.perf_counter()
+            if self.timers is not None:
+                self.timers.add("acquire", acquired - start)
+                self.timers.add("convert", converted - acquired)
+            self.stats.on_capture()
+            self.slot.publish(Frame(image, sequence, converted, stamp))
+            sequence += 1
+
+    def _inference_loop(self):
+        while self._running:
+            frame = self.slot.take(timeout=0.5)
+            if frame is None:
+                continue
+            start = time.perf_counter()
+            if self.timers is not None:
+                self.timers.add("age", start - frame.arrival)
+            try:
+                self.process(frame)
+            except Exception as e:
+                self.logs.error("[%s] Inference failed: %s" % (self.name, str(e)))
+            self.stats.on_processed(start - frame.arrival, time.perf_counter())
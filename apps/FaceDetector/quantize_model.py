@@ -0,0 +1,110 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import argparse
+from backends import yunet_blob
+from benchmark_backends import load_frames
+
+
+class FrameCalibrationReader:
+    """onnxruntime CalibrationDataReader feeding recorded frames as YuNet input blobs."""
+
+    def __init__(self, input_name, frames):
+        self.input_name = input_name
+        self.frames = iter(frames)
+
+    def get_next(self):
+        rgb = next(self.frames, None)
+        if rgb is None:
+            return None
+        blob, _ = yunet_blob(rgb)
+        return {self.input_name: blob}
+
+
+def quantize_int8(model_path, output_path, calibration, max_frames):
+    import onnx
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_static
+
+    frames = load_frames(calibration, max_frames)
+    if not frames:
+        raise SystemExit("No calibration frames loaded from %s" % calibration)
+    input_name = onnx.load(model_path).graph.input[0].name
+    quantize_static(model_path, output_path, FrameCalibrationReader(input_name, frames),
+                    quant_format=QuantFormat.QDQ, activation_type=QuantType.QUInt8,
+                    weight_type=QuantType.QInt8, per_channel=True)
+
+
+def convert_fp16(model_path, output_path):
+    import onnx
+    from onnxconverter_common import float16
+
+    model = float16.convert_float_to_float16(onnx.load(model_path), keep_io_types=True)
+    onnx.save(model, output_path)
+
+
+def convert_openvino(model_path, output_path, fp16):
+    import openvino as ov
+
+    model = ov.Core().read_model(model_path)
+    ov.save_model(model, output_path, compress_to_fp16=fp16)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantize/convert the FaceDetector ONNX model for CPU inference")
+    parser.add_argument("model", help="input FP32 ONNX model")
+    parser.add_argument("output", help="output .onnx (or .xml with --openvino)")
+    parser.add_argument("--precision", choices=("int8", "fp16", "fp32"), default="int8")
+    parser.add_argument("--openvino", action="store_true", help="save as OpenVINO IR instead of ONNX")
+    parser.add_argument("--calibration", help="video file or folder of images for INT8 calibration")
+    parser.add_argument("--max-frames", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.openvino:
+        if args.precision == "int8":
+            raise SystemExit("Quantize to INT8 ONNX first, then convert it with --openvino --precision fp32")
+        convert_openvino(args.model, args.output, fp16=args.precision == "fp16")
+    elif args.precision == "int8":
+        if not args.calibration:
+            raise SystemExit("--calibration is required for INT8 quantization")
+        quantize_int8(args.model, args.output, args.calibration, args.max_frames)
+    elif args.precision == "fp16":
+        convert_fp16(args.model, args.output)
+    else:
+        raise SystemExit("Nothing to do for an FP32 ONNX output")
+    print("Saved %s" % args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import argparse
+import signal
+import yarp
+from frames import YarpFrameAdapter
+from recording import FrameRecorder
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record a YARP image stream for offline FaceDetector benchmarks")
+    parser.add_argument("output", help="recording file (e.g. session%s)" % FrameRecorder.EXTENSION)
+    parser.add_argument("--src", default="/grabber", help="image port to record from")
+    parser.add_argument("--port", default="/iFaceDetector/recorder/image:i")
+    parser.add_argument("--max-frames", type=int, default=0, help="stop after this many frames (0: until Ctrl+C)")
+    args = parser.parse_args()
+
+    yarp.Network.init()
+    port = yarp.BufferedPortImageRgb()
+    port.setStrict(True)  # keep every frame, the recorder only appends to a file
+    if not port.open(args.port):
+        raise SystemExit("Cannot open %s" % args.port)
+    if not yarp.Network.connect(args.src, args.port, "tcp"):
+        raise SystemExit("Cannot connect %s to %s" % (args.src, args.port))
+
+    running = [True]
+    signal.signal(signal.SIGINT, lambda *_: running.__setitem__(0, False))
+
+    frames = YarpFrameAdapter(order="rgb")
+    recorder = FrameRecorder(args.output)
+    envelope = yarp.Stamp()
+    while running[0] and (args.max_frames <= 0 or recorder.count < args.max_frames):
+        yarp_image = port.read(False)
+        if yarp_image is None:
+            yarp.delay(0.001)
+            continue
+        port.getEnvelope(envelope)
+        stamp = envelope.getTime() if envelope.isValid() else yarp.now()
+        recorder.write(frames.convert(yarp_image), stamp)
+
+    recorder.close()
+    port.close()
+    yarp.Network.fini()
+    print("Recorded %d frames (%dx%d) to %s, %d skipped after a resolution change"
+          % (recorder.count, recorder.width, recorder.height, args.output, recorder.skipped))
+
+
+if __name__ == "__main__":
+    main()
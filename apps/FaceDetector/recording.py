@@ -0,0 +1,120 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import os
+import struct
+import numpy as np
+
+MAGIC = b"IFDREC01"
+# magic, width, height, reserved
+HEADER = struct.Struct("<8sIII")
+
+
+def _record_dtype(width, height):
+    return np.dtype([("stamp", "<f8"), ("image", "u1", (height, width, 3))])
+
+
+class FrameRecorder:
+    """
+    Append RGB frames and their timestamps to a recording file.
+
+    The file is a small header followed by fixed-size records (float64 stamp,
+    raw h x w x 3 uint8 RGB), so it can be memory-mapped as a NumPy structured
+    array by FrameRecording without any decoding.
+    """
+
+    EXTENSION = ".frames"
+
+    def __init__(self, path):
+        self.path = path
+        self.width = 0
+        self.height = 0
+        self.count = 0
+        self.skipped = 0
+        self._file = None
+        self._stamp = np.zeros(1, dtype="<f8")
+
+    def write(self, rgb, stamp):
+        """Append a frame; frames whose resolution differs from the first one are skipped."""
+        h, w = rgb.shape[:2]
+        if self._file is None:
+            self._file = open(self.path, "wb")
+            self._file.write(HEADER.pack(MAGIC, w, h, 0))
+            self.width, self.height = w, h
+        elif (w, h) != (self.width, self.height):
+            self.skipped += 1
+            return False
+
+        self._stamp[0] = stamp
+        self._file.write(self._stamp.tobytes())
+        self._file.write(np.ascontiguousarray(rgb, dtype=np.uint8).data)
+        self.count += 1
+        return True
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class FrameRecording:
+    """Read-only, memory-mapped view of a file written by FrameRecorder."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, self.width, self.height, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("%s is not a frame recording" % path)
+        dtype = _record_dtype(self.width, self.height)
+        if os.path.getsize(path) - HEADER.size < dtype.itemsize:
+            self.records = np.zeros(0, dtype=dtype)
+        else:
+            self.records = np.memmap(path, dtype=dtype, mode="r", offset=HEADER.size)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def stamps(self):
+        return self.records["stamp"]
+
+    def image(self, index):
+        return self.records["image"][index]
+
+    def duration(self):
+        if len(self) < 2:
+            return 0.0
+        return float(self.stamps[-1] - self.stamps[0])
@@ -0,0 +1,172 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import argparse
+import json
+import resource
+import sys
+import time
+import numpy as np
+import yarp
+from app import iFaceDetector
+from recording import FrameRecording
+
+PERCENTILES = (50, 95, 99)
+
+
+class TimedBackend:
+    """Detector backend proxy recording the latency of every detect() call."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.samples = []
+
+    def detect(self, rgb):
+        start = time.perf_counter()
+        detections = self.backend.detect(rgb)
+        self.samples.append(time.perf_counter() - start)
+        return detections
+
+    def close(self):
+        self.backend.close()
+
+
+def replay(module, recording, realtime=False, speed=1.0):
+    """Feed every recorded frame through the module's conversion and detection path."""
+    h, w = recording.height, recording.width
+    source = np.zeros((h, w, 3), dtype=np.uint8)
+    image = yarp.ImageRgb()
+    image.resize(w, h)
+    image.setExternal(source.data, w, h)
+
+    stages = {"read": [], "convert": [], "process": []}
+    detected = 0
+    stamps = recording.stamps
+    start = time.perf_counter()
+    for i in range(len(recording)):
+        if realtime:
+            delay = start + (stamps[i] - stamps[0]) / speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        t0 = time.perf_counter()
+        np.copyto(source, recording.image(i))
+        t1 = time.perf_counter()
+        rgb = module.frames.convert(image)
+        t2 = time.perf_counter()
+        midpoint = module.process_frame(rgb, yarp.Stamp(i, float(stamps[i])))
+        t3 = time.perf_counter()
+
+        stages["read"].append(t1 - t0)
+        stages["convert"].append(t2 - t1)
+        stages["process"].append(t3 - t2)
+        detected += midpoint is not None
+    return time.perf_counter() - start, stages, detected
+
+
+def summarize(samples):
+    samples = np.array(samples) * 1e3
+    if samples.size == 0:
+        return {}
+    summary = {"p%d" % p: float(np.percentile(samples, p)) for p in PERCENTILES}
+    summary["mean"] = float(samples.mean())
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recording through iFaceDetector without a robot. "
+                                                 "Unknown options (e.g. --backend face) are passed to the module.")
+    parser.add_argument("recording", help="file written by record.py")
+    parser.add_argument("--realtime", action="store_true", help="replay at recorded speed instead of flat out")
+    parser.add_argument("--speed", type=float, default=1.0, help="speed factor for --realtime")
+    parser.add_argument("--report", help="also write the report as JSON to this file")
+    args, module_args = parser.parse_known_args()
+
+    recording = FrameRecording(args.recording)
+    if len(recording) == 0:
+        raise SystemExit("%s contains no frames" % args.recording)
+
+    # Process-local ports: no yarpserver, camera or robot needed
+    yarp.Network.init()
+    yarp.Network.setLocalMode(True)
+
+    rf = yarp.ResourceFinder()
+    rf.configure([sys.argv[0]] + module_args)
+    if rf.check("pipelined") and rf.find("pipelined").asBool():
+        raise SystemExit("The replay drives the detection path directly; do not pass --pipelined")
+
+    module = iFaceDetector()
+    if not module.configure(rf):
+        raise SystemExit("iFaceDetector configuration failed")
+    timed = TimedBackend(module.detector)
+    module.detector = timed
+
+    elapsed, stages, detected = replay(module, recording, args.realtime, args.speed)
+    module.close()
+    yarp.Network.fini()
+
+    stages["detect"] = timed.samples
+    skipped = module.gate.skipped if module.gate is not None else 0
+    inferred = len(recording) - skipped
+    report = {
+        "recording": args.recording,
+        "frames": len(recording),
+        "resolution": [recording.width, recording.height],
+        "backend": module.backend_name,
+        "realtime": args.realtime,
+        "elapsed_s": elapsed,
+        "throughput_fps": len(recording) / elapsed,
+        "skipped_frames": skipped,
+        "detection_rate": detected / inferred if inferred else 0.0,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+        "stages_ms": {name: summarize(samples) for name, samples in stages.items()},
+    }
+
+    print("%d frames %dx%d, backend '%s', %.1f fps, detection rate %.1f%%, peak RSS %.0f MB" % (
+        report["frames"], recording.width, recording.height, report["backend"], report["throughput_fps"],
+        100.0 * report["detection_rate"], report["peak_rss_mb"]))
+    print("%-8s %9s %9s %9s %9s" % ("stage", "mean[ms]", "p50[ms]", "p95[ms]", "p99[ms]"))
+    for name, summary in report["stages_ms"].items():
+        if summary:
+            print("%-8s %9.3f %9.3f %9.3f %9.3f" % (name, summary["mean"], summary["p50"], summary["p95"], summary["p99"]))
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
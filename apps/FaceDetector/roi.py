@@ -0,0 +1,94 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+
+class RoiTracker:
+    """
+    Keep a square region of interest around the last detected eye midpoint.
+
+    The crop side is `scale` times the last inter-ocular distance (at least
+    `min_size` pixels). Each miss enlarges the crop by `growth`; after
+    `max_misses` consecutive misses the tracker falls back to the full frame.
+    """
+
+    def __init__(self, scale=6.0, min_size=128, growth=1.5, max_misses=3):
+        self.scale = scale
+        self.min_size = min_size
+        self.growth = growth
+        self.max_misses = max_misses
+        self.center = None
+        self.size = 0.0
+        self.misses = 0
+        self.roi_frames = 0
+        self.full_frames = 0
+
+    @property
+    def tracking(self):
+        return self.center is not None
+
+    def crop_box(self, width, height):
+        """Return the (x0, y0, x1, y1) crop for the next frame, or None for the full frame."""
+        if self.center is None:
+            self.full_frames += 1
+            return None
+
+        side = int(min(self.size, width, height))
+        cx, cy = self.center
+        x0 = int(min(max(cx - side // 2, 0), width - side))
+        y0 = int(min(max(cy - side // 2, 0), height - side))
+        if side >= width and side >= height:
+            self.full_frames += 1
+            return None
+        self.roi_frames += 1
+        return x0, y0, x0 + side, y0 + side
+
+    def hit(self, midpoint, eye_distance):
+        self.center = midpoint
+        self.size = max(self.scale * eye_distance, self.min_size)
+        self.misses = 0
+
+    def miss(self):
+        if self.center is None:
+            return
+        self.misses += 1
+        if self.misses >= self.max_misses:
+            self.reset()
+        else:
+            self.size *= self.growth
+
+    def reset(self):
+        self.center = None
+        self.size = 0.0
+        self.misses = 0
@@ -0,0 +1,131 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import time
+import numpy as np
+
+RUNTIMES = ("onnxruntime", "openvino")
+
+
+class InferenceSession:
+    """
+    Thin wrapper around a CPU inference runtime.
+
+    `input_size` is the (height, width) the model was exported with, or None when
+    the spatial dimensions are dynamic. `run(blob)` returns a dict mapping output
+    names to NumPy arrays.
+    """
+
+    runtime = None
+
+    def __init__(self):
+        self.input_name = None
+        self.input_size = None
+
+    def run(self, blob):
+        raise NotImplementedError
+
+    def warmup(self, height, width, runs=3):
+        """Run a few dummy inferences so that allocations and kernel selection happen at startup."""
+        if self.input_size is not None:
+            height, width = self.input_size
+        blob = np.zeros((1, 3, height, width), dtype=np.float32)
+        start = time.perf_counter()
+        for _ in range(runs):
+            self.run(blob)
+        return (time.perf_counter() - start) / max(runs, 1)
+
+
+class OnnxRuntimeSession(InferenceSession):
+    runtime = "onnxruntime"
+
+    def __init__(self, model_path, threads=1):
+        super().__init__()
+        import onnxruntime as ort
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.input_size = _static_size(model_input.shape)
+        self.output_names = [output.name for output in self.session.get_outputs()]
+
+    def run(self, blob):
+        outputs = self.session.run(self.output_names, {self.input_name: blob})
+        return dict(zip(self.output_names, outputs))
+
+
+class OpenVinoSession(InferenceSession):
+    runtime = "openvino"
+
+    def __init__(self, model_path, threads=1):
+        super().__init__()
+        import openvino as ov
+        core = ov.Core()
+        model = core.read_model(model_path)
+        config = {"PERFORMANCE_HINT": "LATENCY"}
+        if threads > 0:
+            config["INFERENCE_NUM_THREADS"] = threads
+        self.compiled = core.compile_model(model, "CPU", config)
+        self.request = self.compiled.create_infer_request()
+
+        model_input = model.input(0)
+        self.input_name = model_input.get_any_name()
+        shape = model_input.get_partial_shape()
+        self.input_size = _static_size([d.get_length() if d.is_static else None for d in shape])
+        self.outputs = [(output.get_any_name(), output) for output in self.compiled.outputs]
+
+    def run(self, blob):
+        self.request.infer({0: blob})
+        return {name: self.request.get_tensor(output).data for name, output in self.outputs}
+
+
+def create_session(runtime, model_path, threads=1):
+    if runtime == OnnxRuntimeSession.runtime:
+        return OnnxRuntimeSession(model_path, threads)
+    if runtime == OpenVinoSession.runtime:
+        return OpenVinoSession(model_path, threads)
+    raise ValueError("Unknown inference runtime '%s' (available: %s)" % (runtime, ", ".join(RUNTIMES)))
+
+
+def _static_size(shape):
+    height, width = shape[2], shape[3]
+    if isinstance(height, int) and isinstance(width, int) and height > 0 and width > 0:
+        return height, width
+    return None
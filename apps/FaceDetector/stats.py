@@ -0,0 +1,149 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import cProfile
+import os
+import threading
+import time
+import numpy as np
+
+
+class RollingHistogram:
+    """
+    Latency samples of one stage over the last `window` frames.
+
+    Recording is a single store into a preallocated ring; percentiles are only
+    computed when the statistics are queried.
+    """
+
+    def __init__(self, window=512):
+        self._samples = np.zeros(window, dtype=np.float64)
+        self._index = 0
+        self.count = 0
+
+    def add(self, seconds):
+        self._samples[self._index] = seconds
+        self._index = (self._index + 1) % len(self._samples)
+        self.count += 1
+
+    def summary(self):
+        """Return (count, mean, p50, p95, p99, max) in milliseconds over the window."""
+        samples = self._samples[:min(self.count, len(self._samples))] * 1e3
+        if samples.size == 0:
+            return self.count, 0.0, 0.0, 0.0, 0.0, 0.0
+        p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+        return self.count, float(samples.mean()), float(p50), float(p95), float(p99), float(samples.max())
+
+
+class StageStats:
+    """Named RollingHistograms, one per stage of the frame processing."""
+
+    FIELDS = ("count", "mean", "p50", "p95", "p99", "max")
+
+    def __init__(self, stages, window=512):
+        self.stages = {stage: RollingHistogram(window) for stage in stages}
+
+    def add(self, stage, seconds):
+        self.stages[stage].add(seconds)
+
+    def fill(self, bottle):
+        """Append one (stage count mean p50 p95 p99 max) list per stage, times in ms."""
+        for stage, histogram in self.stages.items():
+            count, *values = histogram.summary()
+            entry = bottle.addList()
+            entry.addString(stage)
+            entry.addInt64(count)
+            for value in values:
+                entry.addFloat64(value)
+
+
+class FrameProfiler:
+    """
+    cProfile hook that can be switched on and off at runtime.
+
+    cProfile only sees the thread it is enabled in, so the processing thread
+    brackets each frame with begin()/end(); with `every` > 1 only one frame in
+    `every` is profiled. The stats of a run are dumped in pstats format.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._profile = None
+        self._active = None
+        self.every = 1
+        self.frames = 0
+        self.profiled = 0
+
+    @property
+    def running(self):
+        return self._profile is not None
+
+    def start(self, every=1):
+        with self._lock:
+            self._profile = cProfile.Profile()
+            self.every = max(1, every)
+            self.frames = 0
+            self.profiled = 0
+
+    def stop(self, path):
+        with self._lock:
+            profile, self._profile = self._profile, None
+        if profile is None:
+            return False
+        # Let the processing thread finish (and disable) a frame being profiled
+        deadline = time.monotonic() + 2.0
+        while self._active is profile and time.monotonic() < deadline:
+            time.sleep(0.005)
+        profile.dump_stats(path)
+        return True
+
+    def begin(self):
+        if self._profile is None:
+            return
+        with self._lock:
+            self.frames += 1
+            if self._profile is not None and self.frames % self.every == 0:
+                self._active = self._profile
+                self._active.enable()
+
+    def end(self):
+        if self._active is not None:
+            self._active.disable()
+            self._active = None
+            self.profiled += 1
+
+    def status(self):
+        """(running frames profiled pid): the pid is what py-spy needs to attach."""
+        return self.running, self.frames, self.profiled, os.getpid()
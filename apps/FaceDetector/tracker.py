@@ -0,0 +1,119 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+Authors:
+    - Joel W. George Currie (joel.currie@iit.it)
+    - Davide De Tommaso (davide.detommaso@iit.it)
+"""
+
+import numpy as np
+
+
+class Track:
+    __slots__ = ("id", "u", "v", "eye_distance", "score", "age", "misses")
+
+    def __init__(self, track_id, detection):
+        self.id = track_id
+        self.age = 0
+        self.misses = 0
+        self.assign(detection)
+
+    def assign(self, detection):
+        self.u, self.v = detection.u, detection.v
+        self.eye_distance = detection.eye_distance
+        self.score = detection.score
+        self.misses = 0
+
+
+class FaceTracker:
+    """
+    Assign stable IDs to faces across frames.
+
+    Detections are matched to tracks greedily by pixel distance, closest pairs
+    first, over a distance matrix computed in one NumPy expression. A pair only
+    matches within `gate` pixels (or twice the track's inter-ocular distance, if
+    larger). Tracks unseen for `max_misses` frames are dropped.
+    """
+
+    def __init__(self, gate=80.0, max_misses=5):
+        self.gate = gate
+        self.max_misses = max_misses
+        self.tracks = []
+        self.primary_id = None
+        self._next_id = 0
+
+    def update(self, detections):
+        """Update the tracks with the detections of a new frame (full-frame pixels) and return them."""
+        for track in self.tracks:
+            track.age += 1
+            track.misses += 1
+
+        unmatched = list(range(len(detections)))
+        if self.tracks and detections:
+            tracks_uv = np.array([(t.u, t.v) for t in self.tracks])
+            dets_uv = np.array([(d.u, d.v) for d in detections])
+            gates = np.maximum(self.gate, 2.0 * np.array([t.eye_distance for t in self.tracks]))
+
+            cost = np.linalg.norm(tracks_uv[:, None, :] - dets_uv[None, :, :], axis=2)
+            cost[cost > gates[:, None]] = np.inf
+            for _ in range(min(cost.shape)):
+                t, d = np.unravel_index(np.argmin(cost), cost.shape)
+                if not np.isfinite(cost[t, d]):
+                    break
+                self.tracks[t].assign(detections[d])
+                unmatched.remove(d)
+                cost[t, :] = np.inf
+                cost[:, d] = np.inf
+
+        for d in unmatched:
+            self.tracks.append(Track(self._next_id, detections[d]))
+            self._next_id += 1
+
+        self.tracks = [t for t in self.tracks if t.misses < self.max_misses]
+        return self.tracks
+
+    def visible(self):
+        """Tracks matched in the last frame."""
+        return [t for t in self.tracks if t.misses == 0]
+
+    def primary(self):
+        """
+        The gaze target: the current target while it is visible, otherwise the
+        visible track with the highest score. Returns None if no face is visible.
+        """
+        visible = self.visible()
+        if not visible:
+            return None
+        for track in visible:
+            if track.id == self.primary_id:
+                return track
+        target = max(visible, key=lambda t: t.score)
+        self.primary_id = target.id
+        return target
@@ -35,13 +35,26 @@ import sys
 import json
 import os
 import re
+import time
+import threading
 from openai import AzureOpenAI
 from openai import APIConnectionError, RateLimitError, Timeout, APIError
 from pyicub.core.logger import YarpLogger
+from streaming import SentenceSplitter
+from request_queue import RequestQueue
+from cache import ResponseCache
+from context import SUMMARY_PREFIX, TokenCounter, split_context, summary_message, summary_request
+
+
+class ReplyError(Exception):
+    """A warning or error answered instead of a reply, e.g. "[ERROR] ..."."""
 
 
 class GPT(yarp.RFModule):
 
+    # Session ids are used in port and file names
+    SESSION_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
     def configure(self, rf):
         self.DEFAULT_SESSION = "default"
 
@@ -59,7 +72,8 @@ class GPT(yarp.RFModule):
         if not (os.path.isdir(self.sessions_folder)):
             os.makedirs(self.sessions_folder)
 
-        self.pending_changes = False
+        # Sessions with unsaved changes
+        self.pending_changes = set()
 
         self.total_tokens_used = 0
 
@@ -73,6 +87,9 @@ class GPT(yarp.RFModule):
         if not self._load_config():
             return False
 
+        # Utterances from text:i and RPC are answered by a pool of workers, in order within a session
+        self.requests = RequestQueue(self._handle_request, workers=self.workers, name="GPT-requests")
+
         self.prompt_path = rf.check("prompt_file", yarp.Value("")).asString()
         self._load_system_prompt()
 
@@ -86,8 +103,13 @@ class GPT(yarp.RFModule):
             self.logs.error(f"[GPT] AzureOpenAI init failed: {e}")
             return False
 
+        # Guards sessions, token_usage, active_session and system_prompt, shared by the RPC,
+        # update and request threads
+        self.sessions_lock = threading.RLock()
         self.sessions = {}
         self.token_usage = {}
+        # Rolling summaries of the turns left out of the context, see _fit_context
+        self.context_summaries = {}
 
         self.active_session = self.DEFAULT_SESSION
 
@@ -97,12 +119,9 @@ class GPT(yarp.RFModule):
 
         #self._load_sessions_from_file()
 
-        self.status = 'idle'
-        self.query_via_rpc = False
-        self.text_via_rpc = ""
-
         # make the first API call here is necessary to establish the connection
         self._model_warmup()
+        self.requests.start()
 
         self.logs.info("[GPT] Configuration complete.")
         return True
@@ -119,6 +138,10 @@ class GPT(yarp.RFModule):
         self.output_port = yarp.BufferedPortBottle()
         self.output_port.open("/GPT/text:o")
 
+        # Outputs of the sessions addressed explicitly: /GPT/<session>/text:o
+        self.session_ports = {}
+        self.output_lock = threading.Lock()
+
         self.rpc_port = yarp.Port()
         self.rpc_port.open("/GPT/rpc:i")
         self.attach(self.rpc_port)
@@ -127,11 +150,33 @@ class GPT(yarp.RFModule):
         try:
             with open(self.config_path, 'r') as f:
                 self.config = json.load(f)
+            # model -> deployment name, or {"deployment": name, "context_budget": tokens}
             self.deployments = self.config['deployments']
             self.current_model = self.config['default_model']
+            self.counter = TokenCounter(self.current_model)
+            # How sessions are kept within the context budget: "trim" or "summary"
+            self.context_strategy = self.config.get('context_strategy', 'trim')
+            self.summary_length = self.config.get('summary_length', 256)
             self.temperature = self.config.get('temperature', 0.7)
             self.top_p = self.config.get('top_p', 1.0)
             self.max_tokens = self.config.get('max_length', 1024)
+            # Stream replies and send them to text:o sentence by sentence
+            self.stream = self.config.get('stream', False)
+            # Sessions answered concurrently
+            self.workers = max(1, int(self.config.get('workers', 1)))
+            # Optional cache of replies: {"capacity": N, "ttl": seconds, "history": N, "file": path}
+            self.cache = None
+            if self.config.get('cache') is not None:
+                options = self.config['cache']
+                self.cache = ResponseCache(capacity=options.get('capacity', 256),
+                                           ttl=options.get('ttl', 86400.0),
+                                           history=options.get('history', 4),
+                                           path=options.get('file'))
+                if self.cache.path:
+                    try:
+                        self.cache.load()
+                    except Exception as e:
+                        self.logs.warning(f"[GPT] Failed to load cache, starting empty: {e}")
             return True
         except Exception as e:
             self.logs.error(f"[GPT] Failed to load config: {e}")
@@ -150,12 +195,16 @@ class GPT(yarp.RFModule):
         self.logs.info(f"[GPT] System prompt: {self.system_prompt}")
 
     def _create_session(self, session_id):
-        self.sessions[session_id] = [{"role": "system", "content": self.system_prompt}]
-        self.token_usage[session_id] = 0
+        with self.sessions_lock:
+            self.sessions[session_id] = [{"role": "system", "content": self.system_prompt}]
+            self.token_usage[session_id] = 0
+            self.context_summaries.pop(session_id, None)
 
     def _reset_session(self, session_id):
-        self.sessions[session_id] = [{"role": "system", "content": self.system_prompt}]
-        self.token_usage[session_id] = 0
+        with self.sessions_lock:
+            self.sessions[session_id] = [{"role": "system", "content": self.system_prompt}]
+            self.token_usage[session_id] = 0
+            self.context_summaries.pop(session_id, None)
 
     def reset_active_session(self):
         self._reset_session(self.active_session)
@@ -165,10 +214,11 @@ class GPT(yarp.RFModule):
         try:
             filename = f"{session_id}.json"
             filepath = os.path.join(self.sessions_folder, filename)
-            data = {
-                "session": self.sessions[session_id], 
-                "token_usage": self.token_usage[session_id]
-            }
+            with self.sessions_lock:
+                data = {
+                    "session": list(self.sessions[session_id]),
+                    "token_usage": self.token_usage[session_id]
+                }
             with open(filepath, 'w') as f:
                 json.dump(data, f, indent=4, ensure_ascii=False)
             self.logs.info(f"[GPT] Session {session_id=} saved in {filepath}")
@@ -224,16 +274,55 @@ class GPT(yarp.RFModule):
         return text.strip()
 
 
-    def _query_llm(self, messages):
+    def _clean_reply(self, raw_reply):
+        reply = self._markdown_to_text(raw_reply)
+        # Replace all whitespace characters (like \n, \t, etc.) with a single space
+        reply = re.sub(r'\s+', ' ', reply)
+        reply = reply.replace('"', "") # speech has a bug, it does not work with hi" for instance.
+        return reply
+
+    def _open_session_port(self, session_id):
+        """Open /GPT/<session_id>/text:o, if not open yet, so it can be connected before the first reply."""
+        with self.output_lock:
+            port = self.session_ports.get(session_id)
+            if port is None:
+                port = yarp.BufferedPortBottle()
+                port.open(f"/GPT/{session_id}/text:o")
+                self.session_ports[session_id] = port
+            return port
+
+    def _write_text(self, text, route=None):
+        port = self.output_port if route is None else self._open_session_port(route)
+        with self.output_lock:
+            out_bottle = port.prepare()
+            out_bottle.clear()
+            out_bottle.addString(text)
+            port.write()
+
+    def _deployment(self, model):
+        entry = self.deployments[model]
+        return entry["deployment"] if isinstance(entry, dict) else entry
+
+    def _context_budget(self, model):
+        """Maximum prompt tokens sent to `model`, or None for no limit."""
+        entry = self.deployments[model]
+        if isinstance(entry, dict) and "context_budget" in entry:
+            return entry["context_budget"]
+        return self.config.get('context_budget')
+
+    def _query_llm(self, messages, stream=False, max_tokens=None):
         try:
+            # Streams report the token usage in a last chunk only if asked to (openai >= 1.26)
+            options = {"stream_options": {"include_usage": True}} if stream else {}
             response = self.client.chat.completions.create(
-                model=self.deployments[self.current_model],
+                model=self._deployment(self.current_model),
                 temperature=self.temperature,
                 top_p=self.top_p,
-                max_tokens=self.max_tokens,
+                max_tokens=max_tokens or self.max_tokens,
                 messages=messages,
                 timeout=30,
-                stream=False
+                stream=stream,
+                **options
             )
             return response
         except RateLimitError as e:
@@ -252,39 +341,206 @@ class GPT(yarp.RFModule):
             self.logs.error(f"[GPT] Unexpected error during API request: {e}")
             return None
 
-    def answer_ChatGPT(self, text_input):
-        if not text_input:
-            return "[WARNING] Empty input"
-
-        self.status = 'generating'
-        self.logs.info(f"[GPT:{self.active_session}] User: {text_input}")
-        self.sessions[self.active_session].append({"role": "user", "content": text_input})
-        response = self._query_llm(self.sessions[self.active_session])
-
-        if response is None:
-            self.status = 'idle'
-            return "[ERROR] Failed to get response. Please try again."
+    def answer_ChatGPT(self, text_input, session_id=None, cancel_event=None, route=None):
+        try:
+            return self._answer(text_input, session_id, cancel_event, route)
+        except ReplyError as e:
+            return str(e)
 
-        raw_reply = response.choices[0].message.content.strip()
+    def _answer(self, text_input, session_id=None, cancel_event=None, route=None):
+        """Answer an utterance; raise ReplyError instead of replying on failure."""
+        if not text_input:
+            raise ReplyError("[WARNING] Empty input")
+
+        user_message = {"role": "user", "content": text_input}
+        with self.sessions_lock:
+            if session_id is None:
+                session_id = self.active_session
+            if session_id not in self.sessions:
+                raise ReplyError(f"[ERROR] Session '{session_id}' not found.")
+            self.logs.info(f"[GPT:{session_id}] User: {text_input}")
+            self.sessions[session_id].append(user_message)
+        messages = self._fit_context(session_id)
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(self.current_model, self.temperature, self.top_p, messages)
+            cached_reply = self.cache.get(cache_key)
+            if cached_reply is not None:
+                self.logs.info(f"[GPT:{session_id}] Reply from cache")
+                self._write_text(cached_reply, route)
+                self._store_reply(session_id, user_message, cached_reply)
+                return cached_reply
+
+        start = time.perf_counter()
+        response = self._query_llm(messages, stream=self.stream)
+
+        if response is not None and self.stream:
+            raw_reply, usage = self._stream_reply(response, start, cancel_event, route)
+            if usage is not None:
+                self._add_usage(session_id, usage.total_tokens)
+            elif raw_reply is not None:
+                # Not reported (e.g. by older API versions): count locally
+                self._add_usage(session_id, self.counter.count(messages) + self.counter.count_text(raw_reply))
+        elif response is not None:
+            raw_reply = (response.choices[0].message.content or "").strip() or None
+            self._add_usage(session_id, response.usage.total_tokens)
+
+        if cancel_event is not None and cancel_event.is_set():
+            self._forget_message(session_id, user_message)
+            raise ReplyError("[WARNING] Request cancelled.")
+
+        if response is None or raw_reply is None:
+            raise ReplyError("[ERROR] Failed to get response. Please try again.")
+
+        full_reply = self._clean_reply(raw_reply)
+        print(full_reply)
 
+        # In streaming mode the sentences have already been sent
+        if not self.stream:
+            self._write_text(full_reply, route)
 
-        full_reply = self._markdown_to_text(raw_reply)
-        # Replace all whitespace characters (like \n, \t, etc.) with a single space
-        full_reply = re.sub(r'\s+', ' ', full_reply)
-        full_reply = full_reply.replace('"', "") # speech has a bug, it does not work with hi" for instance.
-        print(full_reply)
+        if cache_key is not None:
+            self.cache.put(cache_key, full_reply)
+        self._store_reply(session_id, user_message, full_reply)
+        return full_reply
 
-        out_bottle = self.output_port.prepare()
-        out_bottle.clear()
-        out_bottle.addString(full_reply)
-        self.output_port.write()
+    def _store_reply(self, session_id, user_message, reply):
+        with self.sessions_lock:
+            # Unless the session was reset or replaced meanwhile
+            if any(message is user_message for message in self.sessions.get(session_id, [])):
+                self.sessions[session_id].append({"role": "assistant", "content": reply})
+                self.pending_changes.add(session_id)
 
-        self.sessions[self.active_session].append({"role": "assistant", "content": full_reply})
-        
-        self.pending_changes = True
+    def _fit_context(self, session_id):
+        """
+        Return the messages to send for a session, within the context budget of the
+        current model: the oldest turns are left out, or folded into a rolling summary.
+        The stored session keeps the full transcript.
+        """
+        budget = self._context_budget(self.current_model)
+        with self.sessions_lock:
+            session = self.sessions[session_id]
+            messages = list(session)
+            # (number of turns after the system prompt it covers, summary message)
+            folded, summary = self.context_summaries.get(session_id, (0, None))
+        if budget is None:
+            return messages
+
+        start = 0
+        while start < len(messages) and messages[start]["role"] == "system":
+            start += 1
+        messages = messages[:start] + ([summary] if summary is not None else []) + messages[start + folded:]
+        if self.counter.count(messages) <= budget:
+            return messages
+
+        # Leave room for the summary that replaces the evicted turns
+        reserve = self.summary_length if self.context_strategy == "summary" else 0
+        head, evicted, recent = split_context(messages, budget - reserve, self.counter)
+
+        if self.context_strategy == "summary" and evicted:
+            response = self._query_llm(summary_request(head, evicted), max_tokens=self.summary_length)
+            if response is not None:
+                self._add_usage(session_id, response.usage.total_tokens)
+                summary = summary_message(response.choices[0].message.content.strip())
+                head = [m for m in head if not m["content"].startswith(SUMMARY_PREFIX)] + [summary]
+                with self.sessions_lock:
+                    # Unless the session was reset or replaced meanwhile
+                    if self.sessions.get(session_id) is session:
+                        self.context_summaries[session_id] = (folded + len(evicted), summary)
+        self.logs.info(f"[GPT:{session_id}] {len(evicted)} messages left out of the context ({self.context_strategy})")
+        return head + recent
+
+    def _add_usage(self, session_id, tokens):
+        """Account the tokens used by a call."""
+        with self.sessions_lock:
+            if session_id in self.token_usage:
+                self.token_usage[session_id] += tokens
+            self.total_tokens_used += tokens
+
+    def _forget_message(self, session_id, message):
+        with self.sessions_lock:
+            session = self.sessions.get(session_id, [])
+            for i in range(len(session) - 1, -1, -1):
+                if session[i] is message:
+                    del session[i]
+                    break
+
+    def _handle_request(self, request):
+        try:
+            return self._answer(request.text, request.session, request.cancel_event, request.route)
+        except ReplyError as e:
+            # Replies to text:i are written to text:o as they are answered; warnings and errors are not
+            if request.source == "port" and not request.cancelled:
+                self._write_text(str(e), request.route)
+            return str(e)
+
+    def _parse_text(self, bottle, first):
+        """Split `[(session <id>)] <text...>` from item `first` of `bottle` into (session or None, text)."""
+        session_id = None
+        if bottle.size() > first and bottle.get(first).isList() and bottle.get(first).asList().get(0).asString() == "session":
+            session_id = bottle.get(first).asList().get(1).asString()
+            first += 1
+        return session_id, " ".join(bottle.get(i).asString() for i in range(first, bottle.size())).strip()
+
+    def _submit(self, session_id, text_input, source):
+        """
+        Queue an utterance for `session_id` (created if needed), whose replies go to
+        /GPT/<session_id>/text:o, or for the active session (replies on text:o) if None.
+        Raise ReplyError if `session_id` is not valid.
+        """
+        if session_id is None:
+            with self.sessions_lock:
+                return self.requests.submit(self.active_session, text_input, source)
+        if not self.SESSION_ID.match(session_id):
+            raise ReplyError(f"[ERROR] Invalid session id '{session_id}'.")
+        self._open_session_port(session_id)
+        with self.sessions_lock:
+            created = session_id not in self.sessions
+            if created:
+                self._create_session(session_id)
+        if created:
+            self.save_session_to_file(session_id)
+        return self.requests.submit(session_id, text_input, source, route=session_id)
 
-        self.status = 'idle'
-        return full_reply
+    def _stream_reply(self, response, start, cancel_event=None, route=None):
+        """
+        Consume a completion stream, sending each complete sentence to text:o as soon
+        as it is ready; return the whole raw reply (None if nothing arrived) and the
+        token usage (None if not reported). The stream is closed early if
+        `cancel_event` is set.
+        """
+        splitter = SentenceSplitter(self._clean_reply)
+        parts = []
+        first_sentence = None
+        usage = None
+        try:
+            for chunk in response:
+                if cancel_event is not None and cancel_event.is_set():
+                    response.close()
+                    return None, usage
+                if getattr(chunk, "usage", None) is not None:
+                    usage = chunk.usage
+                # Azure sends chunks without choices (e.g. content filter results)
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                parts.append(chunk.choices[0].delta.content)
+                for sentence in splitter.feed(parts[-1]):
+                    if first_sentence is None:
+                        first_sentence = time.perf_counter() - start
+                    self._write_text(sentence, route)
+        except Exception as e:
+            self.logs.error(f"[GPT] Stream interrupted: {e}")
+            if not parts:
+                return None, usage
+        for sentence in splitter.flush():
+            if first_sentence is None:
+                first_sentence = time.perf_counter() - start
+            self._write_text(sentence, route)
+        if first_sentence is not None:
+            self.logs.info(f"[GPT] First sentence after {first_sentence:.3f} s, whole reply after {time.perf_counter() - start:.3f} s")
+        # Only whitespace, or no content at all
+        return "".join(parts).strip() or None, usage
 
     def _set_system_prompt_from_file(self, abs_filepath):
         try:
@@ -299,15 +555,22 @@ class GPT(yarp.RFModule):
             return f"[ERROR] Failed to load system prompt from {abs_filepath} file: {e}"
         
     def _set_system_prompt(self, system_prompt):
-        self.system_prompt = system_prompt
-        self.reset_active_session()
+        with self.sessions_lock:
+            self.system_prompt = system_prompt
+            self.reset_active_session()
         return 'System prompt updated.'
 
     def respond(self, command, reply):
         cmd = command.get(0).asString()
 
-        if cmd == 'status':
-            reply.addString(self.status)
+        if cmd == 'status' and command.size() > 1:
+            request = self.requests.get(command.get(1).asInt32())
+            if request is None:
+                reply.addString(f"[ERROR] Unknown request '{command.get(1).toString()}'.")
+            else:
+                request.fill(reply)
+        elif cmd == 'status':
+            reply.addString('generating' if self.requests.running() else 'idle')
         elif cmd == 'reset':
             self.reset_active_session()
             reply.addString('Session reset.')
@@ -315,12 +578,29 @@ class GPT(yarp.RFModule):
             self.close()
             reply.addString('Quit command sent.')
         elif cmd == 'query':
-            self.query_via_rpc = True
-            text_input = " ".join(command.get(i).asString() for i in range(1, command.size())).strip()
-            self.text_via_rpc = text_input
-            answer = self.answer_ChatGPT(text_input)
-            reply.addString(answer)
-            self.query_via_rpc = False
+            # Blocking: waits for the reply, queued behind the pending requests
+            session_id, text_input = self._parse_text(command, 1)
+            try:
+                request = self._submit(session_id, text_input, "rpc")
+            except ReplyError as e:
+                reply.addString(str(e))
+                return True
+            request.wait()
+            reply.addString(request.reply if request.reply is not None else f"[ERROR] {request.error or request.state}")
+        elif cmd == 'submit':
+            # Non-blocking: replies with the request id, see 'status <id>'
+            session_id, text_input = self._parse_text(command, 1)
+            try:
+                reply.addInt32(self._submit(session_id, text_input, "rpc").id)
+            except ReplyError as e:
+                reply.addString(str(e))
+        elif cmd == 'cancel':
+            session_id, _ = self._parse_text(command, 1)
+            request_id = command.get(1).asInt32() if command.size() > 1 and session_id is None else None
+            if self.requests.cancel(request_id, session_id):
+                reply.addString('Request cancelled.')
+            else:
+                reply.addString('[ERROR] No pending request.')
         elif cmd == 'set_system_prompt':
             new_prompt = " ".join(command.get(i).asString() for i in range(1, command.size())).strip()
             res = self._set_system_prompt(new_prompt)
@@ -331,22 +611,65 @@ class GPT(yarp.RFModule):
             reply.addString(res)
         elif cmd == 'create_session':
             session_id = command.get(1).asString()
+            if not self.SESSION_ID.match(session_id):
+                reply.addString(f"[ERROR] Invalid session id '{session_id}'.")
+                return True
             self._create_session(session_id)
+            self._open_session_port(session_id)
             self.save_session_to_file(session_id)
             reply.addString(f"Session '{session_id}' created.")
         elif cmd == 'switch_session':
             session_id = command.get(1).asString()
-            if session_id in self.sessions:
-                self.active_session = session_id
+            with self.sessions_lock:
+                found = session_id in self.sessions
+                if found:
+                    self.active_session = session_id
+            if found:
                 reply.addString(f"Switched to session '{session_id}'.")
             else:
                 reply.addString(f"[ERROR] Session '{session_id}' not found.")
         elif cmd == 'list_sessions':
-            reply.addString(", ".join(self.sessions.keys()))
+            with self.sessions_lock:
+                reply.addString(", ".join(self.sessions.keys()))
+        elif cmd == 'token_usage':
+            with self.sessions_lock:
+                session_id = command.get(1).asString() if command.size() > 1 else self.active_session
+                if session_id in self.sessions:
+                    context = self.counter.count(self.sessions[session_id])
+                    used = self.token_usage[session_id]
+                    total = self.total_tokens_used
+            if session_id in self.token_usage:
+                budget = self._context_budget(self.current_model)
+                for key, value in (("session", session_id), ("context", context),
+                                   ("budget", budget if budget is not None else -1),
+                                   ("used", used), ("total", total)):
+                    entry = reply.addList()
+                    entry.addString(key)
+                    if isinstance(value, str):
+                        entry.addString(value)
+                    else:
+                        entry.addInt32(value)
+            else:
+                reply.addString(f"[ERROR] Session '{session_id}' not found.")
+        elif cmd == 'cache':
+            if self.cache is None:
+                reply.addString('[ERROR] Cache disabled.')
+            elif command.size() > 1 and command.get(1).asString() == 'clear':
+                self.cache.clear()
+                reply.addString('Cache cleared.')
+            else:
+                for key, value in self.cache.stats().items():
+                    entry = reply.addList()
+                    entry.addString(key)
+                    if isinstance(value, float):
+                        entry.addFloat64(value)
+                    else:
+                        entry.addInt32(value)
         elif cmd == 'set_model':
             model_name = command.get(1).asString()
             if model_name in self.deployments:
                 self.current_model = model_name
+                self.counter = TokenCounter(model_name)
                 reply.addString(f"Model set to '{model_name}'.")
             else:
                 reply.addString(f"[ERROR] Unknown model '{model_name}'.")
@@ -357,33 +680,50 @@ class GPT(yarp.RFModule):
 
     def updateModule(self):
         if self.pending_changes:
-            self.pending_changes = False
-            if not (self.active_session == self.DEFAULT_SESSION):
-                self.save_active_session_to_file()
-
-        if not self.query_via_rpc:
-            bottle = self.input_port.read(False)
-            if bottle is not None:
-                text_input = " ".join(bottle.get(i).asString() for i in range(bottle.size())).strip()
-                answer = self.answer_ChatGPT(text_input)
-                bot = self.output_port.prepare()
-                bot.clear()
-                bot.addString(answer)
-                self.output_port.write()
+            with self.sessions_lock:
+                changed, self.pending_changes = self.pending_changes, set()
+            for session_id in changed:
+                if not (session_id == self.DEFAULT_SESSION):
+                    self.save_session_to_file(session_id)
+        if self.cache is not None and self.cache.dirty:
+            self._save_cache()
+
+        bottle = self.input_port.read(False)
+        if bottle is not None:
+            session_id, text_input = self._parse_text(bottle, 0)
+            try:
+                self._submit(session_id, text_input, "port")
+            except ReplyError as e:
+                self.logs.warning(f"[GPT] {e}")
+                self._write_text(str(e))
         return True
 
+    def _save_cache(self):
+        if not self.cache.path:
+            return
+        try:
+            self.cache.save()
+        except Exception as e:
+            self.logs.error(f"[GPT] Failed to save cache: {e}")
+
     def getPeriod(self):
         return self.period
 
     def close(self):
         self.logs.info("[GPT] Closing ports...")
+        self.requests.stop()
+        if self.cache is not None:
+            self._save_cache()
         self.input_port.close()
         self.output_port.close()
+        for port in self.session_ports.values():
+            port.close()
         self.rpc_port.close()
         return True
 
     def interruptModule(self):
         self.logs.info("[GPT] Interrupting module...")
+        self.requests.stop()
         self.input_port.interrupt()
         self.output_port.interrupt()
         self.rpc_port.interrupt()
@@ -0,0 +1,126 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+import yarp
+from app import GPT
+from mock_server import MockOpenAIServer
+
+
+def configure(stream, endpoint, folder):
+    config_path = os.path.join(folder, "config_%s.json" % ("stream" if stream else "blocking"))
+    with open(config_path, "w") as f:
+        json.dump({
+            "endpoint": endpoint,
+            "api_version": "2024-12-01-preview",
+            "deployments": {"mock": "mock"},
+            "default_model": "mock",
+            "AZURE_API_KEY": "mock",
+            "stream": stream,
+        }, f)
+    rf = yarp.ResourceFinder()
+    rf.configure(["benchmark", "--config", config_path, "--sessions_folder", os.path.join(folder, "sessions")])
+    module = GPT()
+    if not module.configure(rf):
+        raise SystemExit("Module configuration failed")
+    return module
+
+
+def run(stream, endpoint, folder, queries):
+    """Return the time to the first text:o bottle and to the whole reply [s] of each query."""
+    module = configure(stream, endpoint, folder)
+    reader = yarp.BufferedPortBottle()
+    reader.open("/benchmark/text:i")
+    yarp.Network.connect("/GPT/text:o", reader.getName())
+
+    arrivals = []
+    running = [True]
+
+    def read():
+        while running[0]:
+            if reader.read(True) is not None:
+                arrivals.append(time.perf_counter())
+
+    thread = threading.Thread(target=read, daemon=True)
+    thread.start()
+
+    results = []
+    for i in range(queries):
+        module.reset_active_session()
+        del arrivals[:]
+        start = time.perf_counter()
+        module.answer_ChatGPT("Hi, who are you?")
+        done = time.perf_counter()
+        time.sleep(0.05)  # let the last bottle through
+        if arrivals:
+            results.append((arrivals[0] - start, done - start, len(arrivals)))
+
+    running[0] = False
+    reader.interrupt()
+    reader.close()
+    module.interruptModule()
+    module.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to first sentence of blocking vs streaming GPT replies, on a local mock server")
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--first-token", type=float, default=0.5, help="mock server first token latency [s]")
+    parser.add_argument("--token-rate", type=float, default=30.0, help="mock server tokens per second")
+    args = parser.parse_args()
+
+    # Process-local ports: no yarpserver needed
+    yarp.Network.init()
+    yarp.Network.setLocalMode(True)
+    server = MockOpenAIServer(first_token=args.first_token, token_rate=args.token_rate).start()
+
+    print("%-10s %12s %12s %10s" % ("mode", "first[s]", "reply[s]", "bottles"))
+    with tempfile.TemporaryDirectory() as folder:
+        for stream in (False, True):
+            results = run(stream, server.url, folder, args.queries)
+            first = sum(r[0] for r in results) / len(results)
+            whole = sum(r[1] for r in results) / len(results)
+            bottles = sum(r[2] for r in results) / len(results)
+            print("%-10s %12.3f %12.3f %10.1f" % ("stream" if stream else "blocking", first, whole, bottles))
+
+    server.stop()
+    yarp.Network.fini()
+
+
+if __name__ == "__main__":
+    main()
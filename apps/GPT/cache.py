@@ -0,0 +1,132 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    Replies cached by model, sampling parameters, system messages and the last
+    `history` messages of the conversation.
+
+    Entries are evicted least recently used beyond `capacity`, and expire `ttl`
+    seconds after they were stored (never if `ttl` is None). With a `path`,
+    `load()` reads the entries from that JSON file and `save()` writes them back.
+    """
+
+    def __init__(self, capacity=256, ttl=86400.0, history=4, path=None):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.history = history
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        self.dirty = False
+        self._entries = OrderedDict()  # key -> (reply, stored)
+        self._lock = threading.Lock()
+
+    def key(self, model, temperature, top_p, messages):
+        system = [message["content"] for message in messages if message["role"] == "system"]
+        recent = [(message["role"], message["content"]) for message in messages if message["role"] != "system"]
+        recent = recent[-self.history:] if self.history > 0 else recent
+        data = json.dumps([model, temperature, top_p, system, recent], ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _alive(self, stored, now):
+        return self.ttl is None or now - stored < self.ttl
+
+    def get(self, key):
+        """Return the cached reply for `key`, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._alive(entry[1], time.time()):
+                del self._entries[key]
+                self.expired += 1
+                self.dirty = True
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, reply):
+        with self._lock:
+            self._entries[key] = (reply, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+            self.dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.dirty = True
+
+    def load(self):
+        """Read the entries still alive from `path`, if it exists."""
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, "r") as f:
+            entries = json.load(f)
+        now = time.time()
+        with self._lock:
+            # Stored least recently used first
+            for key, reply, stored in entries[-self.capacity:]:
+                if self._alive(stored, now):
+                    self._entries[key] = (reply, stored)
+
+    def save(self):
+        """Write the entries to `path` atomically, so a crash never leaves a truncated cache."""
+        with self._lock:
+            entries = [[key, reply, stored] for key, (reply, stored) in self._entries.items()]
+            self.dirty = False
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"size": len(self._entries), "capacity": self.capacity, "hits": self.hits,
+                    "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0,
+                    "expired": self.expired, "evicted": self.evicted}
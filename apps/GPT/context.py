@@ -0,0 +1,117 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+SUMMARY_PREFIX = "Summary of the earlier conversation: "
+
+# Per-message overhead of the chat format, and of priming the reply
+MESSAGE_TOKENS = 4
+REPLY_TOKENS = 3
+
+
+class TokenCounter:
+    """
+    Count tokens locally, with tiktoken if installed or about 4 characters per token otherwise.
+
+    Counts are cached by content, so each message of a session is encoded once
+    however many times the history is sent.
+    """
+
+    def __init__(self, model="gpt-4o", cache_size=4096):
+        self.encoding = None
+        if tiktoken is not None:
+            try:
+                self.encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self.encoding = tiktoken.get_encoding("o200k_base")
+        self.cache_size = cache_size
+        self._cache = {}
+
+    def count_text(self, text):
+        count = self._cache.get(text)
+        if count is None:
+            count = len(self.encoding.encode(text)) if self.encoding is not None else (len(text) + 3) // 4
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[text] = count
+        return count
+
+    def count_message(self, message):
+        return MESSAGE_TOKENS + self.count_text(message.get("content") or "")
+
+    def count(self, messages):
+        return REPLY_TOKENS + sum(self.count_message(message) for message in messages)
+
+
+def split_context(messages, budget, counter):
+    """
+    Split a session into (head, evicted, recent) so that head + recent fits in `budget` tokens.
+
+    The head is the leading system messages (the system prompt and a rolling
+    summary, if any) and is always kept, as is the latest message; older turns
+    are evicted first, whole, so that the recent history never starts with an
+    assistant reply.
+    """
+    start = 0
+    while start < len(messages) and messages[start]["role"] == "system":
+        start += 1
+    head, history = messages[:start], messages[start:]
+
+    used = counter.count(head)
+    first = len(history)
+    while first > 0 and (first == len(history) or used + counter.count_message(history[first - 1]) <= budget):
+        used += counter.count_message(history[first - 1])
+        first -= 1
+    while first < len(history) - 1 and history[first]["role"] == "assistant":
+        first += 1
+    return head, history[:first], history[first:]
+
+
+def summary_message(summary):
+    return {"role": "system", "content": SUMMARY_PREFIX + summary}
+
+
+def summary_request(head, evicted):
+    """Messages asking the model to fold the evicted turns into the rolling summary of `head`, if any."""
+    previous = [m["content"][len(SUMMARY_PREFIX):] for m in head if m["content"].startswith(SUMMARY_PREFIX)]
+    transcript = "\n".join("%s: %s" % (m["role"], m["content"]) for m in evicted)
+    if previous:
+        transcript = "Previous summary: %s\n\n%s" % (previous[-1], transcript)
+    return [
+        {"role": "system", "content": "Summarize the conversation below in a few sentences, keeping the names, "
+                                      "facts, preferences and commitments needed to continue it."},
+        {"role": "user", "content": transcript},
+    ]
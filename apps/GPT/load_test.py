@@ -0,0 +1,113 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import numpy as np
+import yarp
+from app import GPT
+from mock_server import MockOpenAIServer
+
+
+def configure(endpoint, folder, workers, stream):
+    config_path = os.path.join(folder, "config_%d.json" % workers)
+    with open(config_path, "w") as f:
+        json.dump({
+            "endpoint": endpoint,
+            "api_version": "2024-12-01-preview",
+            "deployments": {"mock": "mock"},
+            "default_model": "mock",
+            "AZURE_API_KEY": "mock",
+            "stream": stream,
+            "workers": workers,
+        }, f)
+    rf = yarp.ResourceFinder()
+    rf.configure(["load_test", "--config", config_path, "--sessions_folder", os.path.join(folder, "sessions")])
+    module = GPT()
+    if not module.configure(rf):
+        raise SystemExit("Module configuration failed")
+    return module
+
+
+def run(module, sessions, per_session):
+    """Submit `per_session` utterances to each session at once; return throughput, latencies and ordering."""
+    start = time.perf_counter()
+    requests = [module._submit("user%d" % s, "Question number %d, please answer." % i, "rpc")
+                for i in range(per_session) for s in range(sessions)]
+    for request in requests:
+        request.wait()
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array([request.finished - request.submitted for request in requests])
+    # Within a session, each request must start after the previous one finished
+    ordered = True
+    for s in range(sessions):
+        own = [request for request in requests if request.session == "user%d" % s]
+        ordered = ordered and all(a.finished <= b.started for a, b in zip(own, own[1:]))
+    failed = sum(request.state != "done" for request in requests)
+    return len(requests) / elapsed, latencies, ordered, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GPT module throughput vs number of concurrent sessions, on a local mock server")
+    parser.add_argument("--workers", type=int, default=4, help="module worker pool size")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--requests", type=int, default=4, help="utterances per session")
+    parser.add_argument("--first-token", type=float, default=0.5, help="mock server first token latency [s]")
+    parser.add_argument("--token-rate", type=float, default=30.0, help="mock server tokens per second")
+    parser.add_argument("--stream", action="store_true", help="stream the replies")
+    args = parser.parse_args()
+
+    # Process-local ports: no yarpserver needed
+    yarp.Network.init()
+    yarp.Network.setLocalMode(True)
+    server = MockOpenAIServer(first_token=args.first_token, token_rate=args.token_rate).start()
+
+    with tempfile.TemporaryDirectory() as folder:
+        module = configure(server.url, folder, args.workers, args.stream)
+        print("%8s %10s %12s %12s %12s %8s %8s" % ("sessions", "requests", "req/s", "mean[s]", "p95[s]", "ordered", "failed"))
+        for sessions in args.sessions:
+            throughput, latencies, ordered, failed = run(module, sessions, args.requests)
+            print("%8d %10d %12.2f %12.2f %12.2f %8s %8d" % (sessions, len(latencies), throughput, latencies.mean(),
+                                                             np.percentile(latencies, 95), ordered, failed))
+        module.interruptModule()
+        module.close()
+
+    server.stop()
+    yarp.Network.fini()
+
+
+if __name__ == "__main__":
+    main()
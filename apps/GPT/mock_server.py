@@ -0,0 +1,166 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_REPLY = ("Hello! I am iCub, a humanoid robot built at the Italian Institute of Technology. "
+                 "I can see, hear and move my head and arms. "
+                 "What would you like to talk about today?")
+
+
+class MockOpenAIServer:
+    """
+    Local OpenAI-compatible chat completion server, for tests and benchmarks without Azure.
+
+    It answers POST .../chat/completions (both the OpenAI and the Azure
+    /openai/deployments/<name>/ paths) with a canned `reply`, streamed or not.
+    Each whitespace-separated word is one token: the first one comes after
+    `first_token` seconds, the others at `token_rate` tokens per second.
+    """
+
+    def __init__(self, reply=DEFAULT_REPLY, first_token=0.5, token_rate=30.0, host="127.0.0.1", port=0):
+        self.reply = reply
+        self.first_token = first_token
+        self.token_rate = token_rate
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                if not self.path.split("?")[0].endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                server.requests += 1
+                server.handle(self, body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return "http://%s:%d/" % (host, port)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-openai", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def tokens(self, body):
+        return re.findall(r"\S+\s*", self.reply)
+
+    def usage(self, body, completion_tokens):
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) + 4 for m in body.get("messages", []))
+        return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens}
+
+    def handle(self, request, body):
+        tokens = self.tokens(body)
+        completion_id = "chatcmpl-%s" % uuid.uuid4().hex
+        model = body.get("model", "mock")
+        if not body.get("stream"):
+            time.sleep(self.first_token + max(len(tokens) - 1, 0) / self.token_rate)
+            self._send_json(request, {
+                "id": completion_id, "object": "chat.completion", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "".join(tokens)}}],
+                "usage": self.usage(body, len(tokens)),
+            })
+            return
+
+        request.send_response(200)
+        request.send_header("Content-Type", "text/event-stream")
+        request.send_header("Cache-Control", "no-cache")
+        request.end_headers()
+
+        def event(choices, **extra):
+            chunk = dict(id=completion_id, object="chat.completion.chunk", created=int(time.time()),
+                         model=model, choices=choices, **extra)
+            request.wfile.write(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+            request.wfile.flush()
+
+        time.sleep(self.first_token)
+        event([{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}])
+        for i, token in enumerate(tokens):
+            if i > 0:
+                time.sleep(1.0 / self.token_rate)
+            event([{"index": 0, "delta": {"content": token}, "finish_reason": None}])
+        event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+        if body.get("stream_options", {}).get("include_usage"):
+            event([], usage=self.usage(body, len(tokens)))
+        request.wfile.write(b"data: [DONE]\n\n")
+        request.wfile.flush()
+
+    @staticmethod
+    def _send_json(request, payload):
+        data = json.dumps(payload).encode()
+        request.send_response(200)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible chat completion server")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--first-token", type=float, default=0.5, help="latency of the first token [s]")
+    parser.add_argument("--token-rate", type=float, default=30.0, help="tokens per second after the first")
+    parser.add_argument("--reply", default=DEFAULT_REPLY)
+    args = parser.parse_args()
+
+    server = MockOpenAIServer(args.reply, args.first_token, args.token_rate, port=args.port).start()
+    print("Serving on %s (use it as 'endpoint' in config.json)" % server.url)
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
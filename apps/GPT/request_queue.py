@@ -0,0 +1,195 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+class Request:
+    """A user utterance to answer: queued, running, done, cancelled or failed."""
+
+    def __init__(self, request_id, session, text, source, route=None):
+        self.id = request_id
+        self.session = session
+        self.text = text
+        self.source = source  # "rpc" or "port"
+        self.route = route    # session whose output port gets the reply, or None for text:o
+        self.state = "queued"
+        self.reply = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.cancel_event = threading.Event()
+        self.done_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def wait(self, timeout=None):
+        """Block until the request is finished; return False on timeout."""
+        return self.done_event.wait(timeout)
+
+    def fill(self, bottle):
+        """Append (id N) (session S) (state S) (elapsed s) [(reply R)] [(error E)]."""
+        end = self.finished if self.finished is not None else time.time()
+        elapsed = end - self.started if self.started is not None else 0.0
+        for key, value in (("id", self.id), ("session", self.session), ("state", self.state), ("elapsed", elapsed),
+                           ("reply", self.reply), ("error", self.error)):
+            if value is None:
+                continue
+            entry = bottle.addList()
+            entry.addString(key)
+            if isinstance(value, int):
+                entry.addInt32(value)
+            elif isinstance(value, float):
+                entry.addFloat64(value)
+            else:
+                entry.addString(value)
+
+
+class RequestQueue:
+    """
+    Answer requests on a pool of `workers` threads.
+
+    Requests of different sessions run concurrently, those of one session
+    strictly in submission order. `submit()` returns immediately;
+    `handler(request)` returns the reply and should give up early once
+    `request.cancel_event` is set.
+    """
+
+    def __init__(self, handler, workers=1, history=64, name="requests"):
+        self.handler = handler
+        self.workers = workers
+        self.history = history
+        self.name = name
+        self._ids = itertools.count(1)
+        self._requests = OrderedDict()
+        self._queue = deque()
+        self._current = {}  # session -> running request
+        self._cond = threading.Condition()
+        self._running = False
+        self._threads = []
+
+    def start(self):
+        self._running = True
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name="%s-%d" % (self.name, i), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self.cancel()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+        self._threads = []
+
+    def submit(self, session, text, source="rpc", route=None):
+        with self._cond:
+            request = Request(next(self._ids), session, text, source, route)
+            self._requests[request.id] = request
+            while len(self._requests) > self.history:
+                self._requests.popitem(last=False)
+            self._queue.append(request)
+            self._cond.notify_all()
+        return request
+
+    def get(self, request_id):
+        with self._cond:
+            return self._requests.get(request_id)
+
+    def pending(self):
+        """Number of requests queued or running."""
+        with self._cond:
+            return len(self._queue) + len(self._current)
+
+    def running(self):
+        """Number of requests running."""
+        with self._cond:
+            return len(self._current)
+
+    def cancel(self, request_id=None, session=None):
+        """
+        Cancel request `request_id`, or all the pending ones (of `session`, if given);
+        return whether anything was cancelled.
+        """
+        with self._cond:
+            requests = [request for request in list(self._queue) + list(self._current.values())
+                        if (request_id is None or request.id == request_id) and
+                        (session is None or request.session == session)]
+            for request in requests:
+                request.cancel_event.set()
+                if request.state == "queued":
+                    self._queue.remove(request)
+                    self._finish(request, "cancelled")
+        return len(requests) > 0
+
+    def _finish(self, request, state):
+        request.state = state
+        request.finished = time.time()
+        request.done_event.set()
+
+    def _next(self):
+        """Oldest queued request whose session has no request running, or None."""
+        for request in self._queue:
+            if request.session not in self._current:
+                return request
+        return None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._next() is not None or not self._running)
+                if not self._running:
+                    return
+                request = self._next()
+                self._queue.remove(request)
+                request.state = "running"
+                request.started = time.time()
+                self._current[request.session] = request
+            try:
+                request.reply = self.handler(request)
+                state = "cancelled" if request.cancelled else "done"
+            except Exception as e:
+                request.error = str(e)
+                state = "failed"
+            with self._cond:
+                del self._current[request.session]
+                self._finish(request, state)
+                # The next request of this session may now run
+                self._cond.notify_all()
@@ -0,0 +1,77 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import re
+
+
+class SentenceSplitter:
+    """
+    Split a streamed reply into complete sentences as it arrives.
+
+    Raw deltas are buffered until a sentence end (terminator followed by
+    whitespace) or a line break; every complete part is cleaned with `clean`,
+    the same clean-up applied to whole replies, and split into sentences.
+    """
+
+    # Terminators, optionally followed by closing markdown/quotes, then whitespace; or line breaks
+    BOUNDARY = re.compile(r"[.!?]+[*_)\"'\]]*\s+|\n+")
+    SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+    LIST_NUMBER = re.compile(r"\s*\d+")
+
+    def __init__(self, clean):
+        self.clean = clean
+        self._buffer = ""
+
+    def feed(self, delta):
+        """Add a delta of the reply and return the sentences it completed."""
+        self._buffer += delta
+        end = 0
+        for match in self.BOUNDARY.finditer(self._buffer):
+            # "1. " at the start of a line is a list marker, not the end of a sentence
+            line_start = self._buffer.rfind("\n", 0, match.start()) + 1
+            if match.group().startswith(".") and self.LIST_NUMBER.fullmatch(self._buffer[line_start:match.start()]):
+                continue
+            end = match.end()
+        if end == 0:
+            return []
+        part, self._buffer = self._buffer[:end], self._buffer[end:]
+        return self._sentences(part)
+
+    def flush(self):
+        """Return the sentences left in the buffer at the end of the reply."""
+        part, self._buffer = self._buffer, ""
+        return self._sentences(part)
+
+    def _sentences(self, part):
+        text = self.clean(part)
+        sentences = (sentence.lstrip(". ") for sentence in self.SENTENCE_END.split(text))
+        return [sentence for sentence in sentences if sentence]
@@ -1,8 +1,17 @@
 import yarp
 import sys
+import threading
 from pyicub.controllers.gaze import GazeController
 from pyicub.core.logger import YarpLogger
 from pyicub.modules.attention import VisualAttention
+from latency import LatencyStats
+from projection import CameraProjection
+from jobs import GuardedGaze, JobRunner
+from gating import GazeCommandGate
+from prediction import TargetPredictor
+from scan import oriented, scan_pattern
+from mock_gaze import MockAttention, MockGazeController
+from events import QUEUE_POLICIES, TargetCallback, TargetQueue, TargetWorker, discard_pending
 
 VOCAB_QUIT = yarp.createVocab32("q", "u", "i", "t")
 
@@ -19,23 +28,151 @@ class VisualAttentionModule(yarp.RFModule):
         self.tracking_camera_active = False
         self.tracking_camera = None
         self.tracking_z = None
+        self.max_target_age = 0.0
+        self.gaze = "robot"
+        self.latency = LatencyStats()
+        # "polling": read the tracking ports every period; "event": act on targets as they arrive
+        self.mode = "polling"
+        # How the targets pending on the tracking ports are reduced: latest, average or fifo
+        self.queue = TargetQueue("latest")
+        self.worker = None
+        self.callbacks = []
+        # Local pixel back-projection, or None to ask iKinGazeCtrl for each target
+        self.projection = None
+        # Suppresses redundant tracking commands (dead-band, rate limit, switch hysteresis)
+        self.gate = GazeCommandGate()
+        # Optional latency compensation of the targets, and how far past "now" to extrapolate [s]
+        self.predictor = None
+        self.prediction_lead = 0.0
+        # "optimized": cached travel-minimizing fixation grids; "pyicub": VisualAttention's own scans
+        self.scan_planner = "optimized"
+        self.scan_grid = (3, 3)
+        self.scan_fixation = 1.0
+        # Scans run as preemptible jobs, off the RPC thread
+        self.jobs = JobRunner(on_cancel=self.stop_gaze, name="%s-jobs" % self.getName())
+        # Serializes gaze commands issued by the update/worker and RPC threads
+        self.gaze_lock = threading.RLock()
 
     def configure(self, rf):
         self.logs.info("[%s] Configuring module..." % self.getName())
         self.period = rf.check("period") and rf.find("period").asFloat64() or 0.1
         self.robot_name = rf.check("robot") and rf.find("robot").asString() or "icubSim"
-        self.gazectrl = GazeController(self.robot_name, self.logs)
-        self.attention = VisualAttention(self.gazectrl)
+        # "robot": iKinGazeCtrl through pyicub; "mock": in-process simulated gaze (mock_gaze.py)
+        self.gaze = rf.check("gaze", yarp.Value("robot")).asString()
+        if self.gaze not in ("robot", "mock"):
+            self.logs.error("[%s] Unknown gaze '%s'." % (self.getName(), self.gaze))
+            return False
+        # Targets older than this [s] are dropped (0 keeps them all)
+        self.max_target_age = rf.check("max_target_age", yarp.Value(0.0)).asFloat64()
+        self.mode = rf.check("mode", yarp.Value("polling")).asString()
+        if self.mode not in ("polling", "event"):
+            self.logs.error("[%s] Unknown mode '%s'." % (self.getName(), self.mode))
+            return False
+        policy = rf.check("queue_policy", yarp.Value("latest")).asString()
+        if policy not in QUEUE_POLICIES:
+            self.logs.error("[%s] Unknown queue policy '%s'." % (self.getName(), policy))
+            return False
+        self.queue = TargetQueue(policy)
+        self.gate = GazeCommandGate(
+            deadband=rf.check("deadband", yarp.Value(1.0)).asFloat64(),
+            max_rate=rf.check("max_command_rate", yarp.Value(20.0)).asFloat64(),
+            switch_angle=rf.check("switch_angle", yarp.Value(15.0)).asFloat64(),
+            switch_cycles=rf.check("switch_cycles", yarp.Value(2)).asInt32())
+        self.scan_planner = rf.check("scan_planner", yarp.Value("optimized")).asString()
+        if self.scan_planner not in ("optimized", "pyicub"):
+            self.logs.error("[%s] Unknown scan planner '%s'." % (self.getName(), self.scan_planner))
+            return False
+        self.scan_grid = (rf.check("scan_rows", yarp.Value(3)).asInt32(), rf.check("scan_cols", yarp.Value(3)).asInt32())
+        self.scan_fixation = rf.check("scan_fixation", yarp.Value(1.0)).asFloat64()
+        if rf.check("prediction") and rf.find("prediction").asBool():
+            self.predictor = TargetPredictor(
+                process_noise=rf.check("process_noise", yarp.Value(1.0)).asFloat64(),
+                measurement_noise=rf.check("measurement_noise", yarp.Value(0.02)).asFloat64(),
+                max_horizon=rf.check("max_horizon", yarp.Value(0.3)).asFloat64(),
+                reset_gap=rf.check("reset_gap", yarp.Value(0.5)).asFloat64(),
+                reset_distance=rf.check("reset_distance", yarp.Value(0.5)).asFloat64())
+            self.prediction_lead = rf.check("prediction_lead", yarp.Value(0.0)).asFloat64()
+        self.gazectrl = self.create_gaze_controller()
+        self.attention = self.create_attention(self.gazectrl)
         self.gazectrl.init()
 
+        projection = rf.check("projection", yarp.Value("local")).asString()
+        if projection not in ("local", "rpc"):
+            self.logs.error("[%s] Unknown projection '%s'." % (self.getName(), projection))
+            return False
+        if projection == "local":
+            refresh = rf.check("projection_refresh", yarp.Value(0.05)).asFloat64()
+            self.projection = CameraProjection(self.gazectrl.IGazeControl, refresh)
+            if not self.projection.load_intrinsics():
+                self.logs.warning("[%s] Camera intrinsics not available, using get3DPoint." % self.getName())
+                self.projection = None
+
         self.cmd_port.open("/%s/cmd:rpc" % self.getName())
         self.track_robot_xyz_port.open("/%s/track_robot_xyz:i" % self.getName())
         self.track_camera_uv_port.open("/%s/track_camera_uv:i" % self.getName())
+        # Keep every bottle so that the queue policy, not YARP, decides which targets are dropped
+        self.track_robot_xyz_port.setStrict(True)
+        self.track_camera_uv_port.setStrict(True)
         self.attach(self.cmd_port)
+        self.jobs.start()
+
+        if self.mode == "event":
+            self.worker = TargetWorker(self.handle_target, self.queue, name="%s-targets" % self.getName())
+            self.worker.start()
+            for kind, port in (("robot", self.track_robot_xyz_port), ("camera", self.track_camera_uv_port)):
+                callback = TargetCallback(kind, port, self.worker.submit)
+                port.useCallback(callback)
+                self.callbacks.append(callback)
 
         self.logs.info("[%s] Module configured successfully." % self.getName())
         return True
 
+    def create_gaze_controller(self):
+        if self.gaze == "mock":
+            return MockGazeController(self.robot_name, self.logs)
+        return GazeController(self.robot_name, self.logs)
+
+    def create_attention(self, gazectrl):
+        if self.gaze == "mock":
+            return MockAttention(gazectrl)
+        return VisualAttention(gazectrl)
+
+    def stop_gaze(self):
+        """Interrupt the ongoing gaze motion, e.g. of a cancelled scan."""
+        try:
+            self.gazectrl.IGazeControl.stopControl()
+        except Exception as e:
+            self.logs.error("[%s] Error stopping the gaze: %s" % (self.getName(), str(e)))
+
+    def reset_tracking(self):
+        """Forget the tracking history, when tracking starts or a scan moves the gaze away."""
+        self.gate.reset()
+        if self.predictor is not None:
+            self.predictor.reset()
+
+    def fixation_point(self):
+        """Current fixation point of the gaze, or None if unavailable."""
+        try:
+            x = yarp.Vector(3)
+            with self.gaze_lock:
+                if self.gazectrl.IGazeControl.getFixationPoint(x):
+                    return (x[0], x[1], x[2])
+        except Exception as e:
+            self.logs.error("[%s] Error reading the fixation point: %s" % (self.getName(), str(e)))
+        return None
+
+    def start_scan(self, kind, center, width, extent):
+        """Run a scan of a region as a job with its own guarded gaze controller; return the job id."""
+        def scan(job):
+            attention = self.create_attention(GuardedGaze(self.gazectrl, job, self.gaze_lock))
+            if self.scan_planner == "pyicub":
+                getattr(attention, kind)(center, width, extent)
+                return
+            pattern = scan_pattern(kind, center, width, extent, *self.scan_grid)
+            attention.observe_points(oriented(pattern, self.fixation_point()), fixation_time=self.scan_fixation)
+        self.reset_tracking()
+        return self.jobs.submit(kind, scan)
+
     def getName(self):
         return self.__class__.__name__
 
@@ -43,33 +180,69 @@ class VisualAttentionModule(yarp.RFModule):
         return self.period
 
     def updateModule(self):
+        if self.mode == "event":
+            return True
+
         if self.tracking_robot_active:
-            bottle = self.track_robot_xyz_port.read(False)
-            if bottle and bottle.size() == 3:
-                    x = bottle.get(0).asFloat64()
-                    y = bottle.get(1).asFloat64()
-                    z = bottle.get(2).asFloat64()
-                    self.attention.observe_points([(x, y, z)], fixation_time=0.1)
+            kind, port, idle = "robot", self.track_robot_xyz_port, self.track_camera_uv_port
         elif self.tracking_camera_active:
-            bottle = self.track_camera_uv_port.read(False)
-            if bottle and bottle.size() == 2:
-                u = bottle.get(0).asInt32()
-                v = bottle.get(1).asInt32()
-                pixel_vector = yarp.Vector(2)
-                pixel_vector[0] = u
-                pixel_vector[1] = v
-                point = yarp.Vector(3)
-                self.gazectrl.IGazeControl.get3DPoint(self.tracking_camera, pixel_vector, self.tracking_z, point)
-                self.attention.observe_points([(point[0], point[1], point[2])], fixation_time=0.1)
-                #print(self.tracking_camera, pixel_vector[0], pixel_vector[1], self.tracking_z)
-                #self.gazectrl.IGazeControl.lookAtMonoPixel(self.tracking_camera, pixel_vector, self.tracking_z)
+            kind, port, idle = "camera", self.track_camera_uv_port, self.track_robot_xyz_port
+        else:
+            discard_pending(self.track_robot_xyz_port)
+            discard_pending(self.track_camera_uv_port)
+            return True
+
+        discard_pending(idle)
+        for target in self.queue.drain(kind, port):
+            self.handle_target(target)
         return True
 
+    def handle_target(self, target):
+        """Send the gaze towards a target, if the matching tracking mode is active and the target is fresh."""
+        active = self.tracking_robot_active if target.kind == "robot" else self.tracking_camera_active
+        if not active:
+            return
+
+        age = yarp.now() - target.stamp if target.stamp is not None else None
+        if self.max_target_age > 0 and age is not None and age > self.max_target_age:
+            self.latency.dropped += 1
+            return
+
+        try:
+            with self.gaze_lock:
+                if target.kind == "robot":
+                    point = target.values
+                elif self.projection is not None:
+                    point = tuple(self.projection.back_project(self.tracking_camera, [target.values], self.tracking_z)[0])
+                    self.gate.viewpoint = self.projection.position(self.tracking_camera)
+                else:
+                    pixel_vector = yarp.Vector(2)
+                    pixel_vector[0] = target.values[0]
+                    pixel_vector[1] = target.values[1]
+                    point = yarp.Vector(3)
+                    self.gazectrl.IGazeControl.get3DPoint(self.tracking_camera, pixel_vector, self.tracking_z, point)
+                    point = (point[0], point[1], point[2])
+                    #self.gazectrl.IGazeControl.lookAtMonoPixel(self.tracking_camera, pixel_vector, self.tracking_z)
+
+                if self.predictor is not None:
+                    now = yarp.now()
+                    self.predictor.update(point, target.stamp if target.stamp is not None else now)
+                    point = tuple(self.predictor.predict(now + self.prediction_lead))
+
+                if not self.gate.should_command(point):
+                    return
+                self.latency.add(yarp.now() - target.stamp if target.stamp is not None else None)
+                self.attention.observe_points([point], fixation_time=0.1)
+        except Exception as e:
+            self.logs.error("[%s] Error tracking target: %s" % (self.getName(), str(e)))
+
     def respond(self, command, reply):
         self.logs.info("[%s] Received command: %s" % (self.getName(), command.toString()))
 
         try:
             if command.get(0).asString() == "start_robot_tracking":
+                self.jobs.cancel()
+                self.reset_tracking()
                 self.tracking_robot_active = True
                 reply.addString("robot_tracking_started")
                 return True
@@ -79,6 +252,13 @@ class VisualAttentionModule(yarp.RFModule):
                 reply.addString("robot_tracking_stopped")
                 return True
 
+            # Reply: (count N) (mean ms) (p50 ms) (p95 ms) (p99 ms) (max ms) (dropped N) (unstamped N)
+            #        (queue (policy P) (received N) (dropped N) (merged N))
+            elif command.get(0).asString() == "latency":
+                self.latency.fill(reply)
+                self.queue.fill(reply)
+                return True
+
             elif command.get(0).asString() == "stop_camera_tracking":
                 self.tracking_camera_active = False
                 reply.addString("camera_tracking_stopped")
@@ -86,27 +266,59 @@ class VisualAttentionModule(yarp.RFModule):
                 
             # Cmd example: start_camera_tracking (camera 0) (z 0.5)
             elif command.check("start_camera_tracking"):
+                # Cancel first: the scan releases the gaze lock at its next command
+                self.jobs.cancel()
+                with self.gaze_lock:
+                    self.tracking_camera = command.find("camera").asInt32()
+                    self.tracking_z = command.find("z").asFloat64()
+                self.reset_tracking()
                 self.tracking_camera_active = True
-                self.tracking_camera = command.find("camera").asInt32()
-                self.tracking_z = command.find("z").asFloat64()
                 reply.addString("camera_tracking_started")
                 return True
 
+            # Reply: (targets N) (commands N) (deadband N) (rate N) (switch N)
+            elif command.get(0).asString() == "gate":
+                for key, value in self.gate.stats().items():
+                    entry = reply.addList()
+                    entry.addString(key)
+                    entry.addInt32(value)
+                return True
+
             # Cmd example: observe_scene (center (-1.0 0.0 0.5)) (width 0.5) (height 0.5)
+            # Reply: ack <job id>
             elif command.check("observe_scene"):
                 center = tuple(map(float, command.find("center").toString().split()))
                 width = command.find("width").asFloat64()
                 height = command.find("height").asFloat64()
-                self.attention.observe_scene(center, width, height)
                 reply.addString("ack")
+                reply.addInt32(self.start_scan("observe_scene", center, width, height))
                 return True
 
             elif command.check("observe_workspace"):
                 center = tuple(map(float, command.find("center").toString().split()))
                 width = command.find("width").asFloat64()
                 depth = command.find("depth").asFloat64()
-                self.attention.observe_workspace(center, width, depth)
                 reply.addString("ack")
+                reply.addInt32(self.start_scan("observe_workspace", center, width, depth))
+                return True
+
+            # Cmd example: status [<job id>]   Reply: (id N) (kind K) (state S) (elapsed s) [(error E)]
+            elif command.get(0).asString() == "status":
+                job = self.jobs.get(command.get(1).asInt32() if command.size() > 1 else None)
+                if job is None:
+                    reply.addString("nack")
+                    reply.addString("unknown job")
+                else:
+                    job.fill(reply)
+                return True
+
+            # Cmd example: cancel [<job id>]
+            elif command.get(0).asString() == "cancel":
+                if self.jobs.cancel(command.get(1).asInt32() if command.size() > 1 else None):
+                    reply.addString("cancelled")
+                else:
+                    reply.addString("nack")
+                    reply.addString("no pending job")
                 return True
 
             elif command.get(0).asVocab() == VOCAB_QUIT:
@@ -126,6 +338,9 @@ class VisualAttentionModule(yarp.RFModule):
 
     def interruptModule(self):
         self.logs.info("[%s] Interrupting module..." % self.getName())
+        self.jobs.stop()
+        if self.worker is not None:
+            self.worker.stop()
         self.cmd_port.interrupt()
         self.track_robot_xyz_port.interrupt()
         self.track_camera_uv_port.interrupt()
@@ -133,6 +348,11 @@ class VisualAttentionModule(yarp.RFModule):
 
     def close(self):
         self.logs.info("[%s] Closing module..." % self.getName())
+        self.jobs.stop()
+        if self.worker is not None:
+            self.worker.stop()
+        for port in (self.track_robot_xyz_port, self.track_camera_uv_port):
+            port.disableCallback()
         self.cmd_port.close()
         self.track_robot_xyz_port.close()
         self.track_camera_uv_port.close()
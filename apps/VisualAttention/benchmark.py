@@ -0,0 +1,148 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import argparse
+import threading
+import time
+import numpy as np
+import yarp
+from app import VisualAttentionModule
+from events import QUEUE_POLICIES
+
+# name: (rate [Hz], burst, description)
+STREAMS = {
+    "walking": (30.0, 1, "a person walking across the image"),
+    "still": (30.0, 1, "a person standing still, with detection jitter"),
+    "bursty": (60.0, 5, "a walking person, detections delivered in bursts"),
+}
+
+
+def target_pixel(stream, i, rate, rng):
+    t = i / rate
+    if stream == "still":
+        return 160 + rng.normal(0.0, 1.5), 120 + rng.normal(0.0, 1.5)
+    return 160 + 120 * np.sin(2.0 * np.pi * 0.1 * t) + rng.normal(0.0, 1.5), 120 + rng.normal(0.0, 1.5)
+
+
+def run(stream, mode, policy, duration, period, options, detection_latency=0.08, seed=0):
+    rate, burst, _ = STREAMS[stream]
+    module = VisualAttentionModule()
+    rf = yarp.ResourceFinder()
+    rf.configure(["benchmark", "--gaze", "mock", "--mode", mode, "--queue_policy", policy,
+                  "--period", str(period)] + options)
+    if not module.configure(rf):
+        raise SystemExit("Module configuration failed")
+    module.tracking_camera, module.tracking_z = 0, 1.0
+    module.tracking_camera_active = True
+
+    writer = yarp.BufferedPortBottle()
+    writer.open("/benchmark/%s/%s/uv:o" % (stream, mode))
+    yarp.Network.connect(writer.getName(), "/%s/track_camera_uv:i" % module.getName())
+
+    running = [True]
+
+    def poll():
+        while running[0]:
+            module.updateModule()
+            time.sleep(module.getPeriod())
+
+    poller = threading.Thread(target=poll, daemon=True) if mode == "polling" else None
+    if poller is not None:
+        poller.start()
+
+    rng = np.random.default_rng(seed)
+    targets = int(rate * duration)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    for i in range(targets):
+        u, v = target_pixel(stream, i, rate, rng)
+        bottle = writer.prepare()
+        bottle.clear()
+        bottle.addInt32(int(round(u)))
+        bottle.addInt32(int(round(v)))
+        # As if the image had been grabbed detection_latency seconds ago
+        writer.setEnvelope(yarp.Stamp(i, yarp.now() - detection_latency))
+        writer.write(True)
+        if (i + 1) % burst == 0:
+            time.sleep(burst / rate)
+    time.sleep(0.2)  # let the last target through
+    cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+
+    running[0] = False
+    if poller is not None:
+        poller.join()
+    writer.close()
+    module.interruptModule()
+    module.close()
+
+    latency = dict(module.latency.summary())
+    gate = module.gate.stats()
+    return {
+        "targets": targets,
+        "commands": len(module.gazectrl.commands),
+        "rate": len(module.gazectrl.commands) / wall,
+        "p50": latency["p50"],
+        "p95": latency["p95"],
+        "suppressed": gate["deadband"] + gate["rate"] + gate["switch"],
+        "dropped": module.queue.dropped,
+        "merged": module.queue.merged,
+        "rpc": module.gazectrl.IGazeControl.calls,
+        "cpu": 100.0 * cpu / wall,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline tracking benchmark of VisualAttentionModule on a mock gaze controller")
+    parser.add_argument("--streams", nargs="+", default=list(STREAMS), choices=list(STREAMS))
+    parser.add_argument("--modes", nargs="+", default=["polling", "event"], choices=["polling", "event"])
+    parser.add_argument("--policy", default="latest", choices=QUEUE_POLICIES, help="queue policy of the tracking ports")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--period", type=float, default=0.1, help="module period [s]")
+    parser.add_argument("--options", default="", help="extra module options, e.g. \"--prediction true --deadband 0\"")
+    args = parser.parse_args()
+
+    # Process-local ports: no yarpserver, robot or iKinGazeCtrl needed
+    yarp.Network.init()
+    yarp.Network.setLocalMode(True)
+
+    columns = ("targets", "commands", "rate", "p50", "p95", "suppressed", "dropped", "merged", "rpc", "cpu")
+    print("%-8s %-8s" % ("stream", "mode") + "".join(" %10s" % c for c in
+          ("targets", "commands", "cmd[Hz]", "p50[ms]", "p95[ms]", "suppressed", "dropped", "merged", "rpc", "cpu[%]")))
+    for stream in args.streams:
+        for mode in args.modes:
+            result = run(stream, mode, args.policy, args.duration, args.period, args.options.split())
+            print("%-8s %-8s" % (stream, mode) + "".join(
+                " %10.1f" % result[c] if isinstance(result[c], float) else " %10d" % result[c] for c in columns))
+    yarp.Network.fini()
+
+
+if __name__ == "__main__":
+    main()
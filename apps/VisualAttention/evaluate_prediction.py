@@ -0,0 +1,149 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import argparse
+import csv
+import numpy as np
+import yarp
+from prediction import TargetPredictor
+
+
+def record(args):
+    """Record the targets received on a port, with their envelope and arrival times, to a CSV file."""
+    yarp.Network.init()
+    port = yarp.BufferedPortBottle()
+    port.setStrict(True)
+    port.open("/evaluate_prediction/targets:i")
+    if not yarp.Network.connect(args.source, port.getName()):
+        raise SystemExit("Cannot connect %s" % args.source)
+    stamp = yarp.Stamp()
+    rows = 0
+    with open(args.output, "w", newline="") as f:
+        writer = csv.writer(f)
+        try:
+            while args.count <= 0 or rows < args.count:
+                bottle = port.read(True)
+                arrival = yarp.now()
+                if bottle is None or not port.getEnvelope(stamp) or not stamp.isValid():
+                    continue
+                writer.writerow([stamp.getTime(), arrival] + [bottle.get(i).asFloat64() for i in range(bottle.size())])
+                rows += 1
+        except KeyboardInterrupt:
+            pass
+    port.close()
+    yarp.Network.fini()
+    print("%d targets written to %s" % (rows, args.output))
+
+
+def load(path):
+    """Return stamps, arrivals, values of a recording, sorted by stamp; the truth is their interpolation."""
+    data = np.loadtxt(path, delimiter=",", ndmin=2)
+    data = data[np.argsort(data[:, 0], kind="stable")]
+    stamps, arrivals, values = data[:, 0], data[:, 1], data[:, 2:]
+
+    def truth(t):
+        return np.array([np.interp(t, stamps, values[:, axis]) for axis in range(values.shape[1])])
+    return stamps, arrivals, values, truth
+
+
+def synthetic(seed, duration=60.0, rate=30.0, noise=0.01, latency=(0.05, 0.15)):
+    """A person walking sideways at 1 m, changing velocity every few seconds, seen through a noisy detector."""
+    rng = np.random.default_rng(seed)
+    dt = 1.0 / rate
+    times = np.arange(0.0, duration, dt)
+    velocity = np.repeat(rng.uniform(-0.8, 0.8, int(duration / 2.0) + 1), int(2.0 * rate))[:len(times)]
+    lateral = np.cumsum(velocity) * dt
+    path = np.column_stack((np.full(len(times), -1.0), lateral, 0.4 + 0.02 * np.sin(2.0 * np.pi * 1.8 * times)))
+    stamps = times
+    # Messages of one stream arrive in order
+    arrivals = np.maximum.accumulate(stamps + rng.uniform(latency[0], latency[1], len(times)))
+    values = path + rng.normal(0.0, noise, path.shape)
+
+    def truth(t):
+        return np.array([np.interp(t, times, path[:, axis]) for axis in range(3)])
+    return stamps, arrivals, values, truth
+
+
+def evaluate(stamps, arrivals, values, truth, lead, predictor):
+    """Position error [units] at command time of the raw targets and of the predicted ones."""
+    order = np.argsort(arrivals, kind="stable")
+    raw, predicted = [], []
+    for i in order:
+        command = arrivals[i] + lead
+        if command > stamps[-1]:
+            continue
+        expected = truth(command)
+        predictor.update(values[i], stamps[i])
+        raw.append(np.linalg.norm(values[i] - expected))
+        predicted.append(np.linalg.norm(predictor.predict(command) - expected))
+    return np.array(raw), np.array(predicted)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay targets to evaluate the latency-compensating predictor")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_record = commands.add_parser("record", help="record targets from a port")
+    parser_record.add_argument("source", help="e.g. /iFaceDetector/eyes:o")
+    parser_record.add_argument("output", help="CSV file: stamp, arrival, values...")
+    parser_record.add_argument("--count", type=int, default=0, help="targets to record (0: until Ctrl+C)")
+
+    parser_evaluate = commands.add_parser("evaluate", help="replay a recording (or a synthetic one)")
+    parser_evaluate.add_argument("recording", nargs="?", help="CSV file from 'record'; synthetic if omitted")
+    parser_evaluate.add_argument("--lead", type=float, default=0.0, help="command time after arrival [s]")
+    parser_evaluate.add_argument("--process-noise", type=float, nargs="+", default=[0.1, 0.3, 1.0, 3.0, 10.0])
+    parser_evaluate.add_argument("--measurement-noise", type=float, default=0.02)
+    parser_evaluate.add_argument("--reset-gap", "--reset_gap", type=float, default=0.5,
+                                 help="restart the filter after a gap longer than this [s]")
+    parser_evaluate.add_argument("--reset-distance", "--reset_distance", type=float, default=0.5,
+                                 help="restart the filter on a jump larger than this [units], e.g. 100 for pixels")
+    parser_evaluate.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args)
+        return
+
+    data = load(args.recording) if args.recording else synthetic(args.seed)
+    print("%-18s %10s %10s %10s %8s" % ("predictor", "mean", "p95", "max", "resets"))
+    raw = None
+    for noise in args.process_noise:
+        predictor = TargetPredictor(process_noise=noise, measurement_noise=args.measurement_noise,
+                                    reset_gap=args.reset_gap, reset_distance=args.reset_distance)
+        raw, predicted = evaluate(*data, lead=args.lead, predictor=predictor)
+        print("%-18s %10.4f %10.4f %10.4f %8d" % ("q=%g" % noise, predicted.mean(),
+                                                  np.percentile(predicted, 95), predicted.max(), predictor.resets))
+    print("%-18s %10.4f %10.4f %10.4f" % ("none (current)", raw.mean(), np.percentile(raw, 95), raw.max()))
+
+
+if __name__ == "__main__":
+    main()
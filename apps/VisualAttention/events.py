@@ -0,0 +1,203 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import threading
+from collections import namedtuple
+import yarp
+
+# kind: "robot" (x, y, z) or "camera" (u, v); stamp: envelope time [s] or None
+Target = namedtuple("Target", ["kind", "values", "stamp"])
+
+TARGET_SIZES = {"robot": 3, "camera": 2}
+
+QUEUE_POLICIES = ("latest", "average", "fifo")
+
+
+def envelope_time(port):
+    """Time of the envelope of the last message read from `port`, or None if it has none."""
+    stamp = yarp.Stamp()
+    if not port.getEnvelope(stamp) or not stamp.isValid():
+        return None
+    return stamp.getTime()
+
+
+def parse_target(kind, bottle, port):
+    """Copy a target out of `bottle` (which YARP reuses), or return None if malformed."""
+    if bottle is None or bottle.size() != TARGET_SIZES[kind]:
+        return None
+    if kind == "robot":
+        values = tuple(bottle.get(i).asFloat64() for i in range(3))
+    else:
+        values = (bottle.get(0).asInt32(), bottle.get(1).asInt32())
+    return Target(kind, values, envelope_time(port))
+
+
+def discard_pending(port):
+    """Read and discard everything pending on a BufferedPortBottle."""
+    for _ in range(port.getPendingReads()):
+        port.read(False)
+
+
+class TargetCallback(yarp.BottleCallback):
+    """Port callback turning each incoming bottle into a Target for `handler`."""
+
+    def __init__(self, kind, port, handler):
+        super().__init__()
+        self.kind = kind
+        self.port = port
+        self.handler = handler
+
+    def onRead(self, bottle, *args):
+        target = parse_target(self.kind, bottle, self.port)
+        if target is not None:
+            self.handler(target)
+
+
+class TargetQueue:
+    """
+    Reduce the targets pending on the tracking ports according to a queue policy.
+
+    - latest:  act on the newest target only, the older ones are dropped
+    - average: merge the pending targets into one at their mean position
+    - fifo:    act on every target, in arrival order
+
+    Pending targets of a different kind than the newest one (e.g. left over
+    from a tracking mode just switched off) are always dropped.
+    """
+
+    def __init__(self, policy="latest"):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError("Unknown queue policy '%s'" % policy)
+        self.policy = policy
+        self.received = 0
+        self.dropped = 0
+        self.merged = 0
+
+    def reduce(self, targets):
+        """Return the targets to act on, in order, out of the pending `targets` (oldest first)."""
+        self.received += len(targets)
+        if len(targets) <= 1 or self.policy == "fifo":
+            return list(targets)
+
+        newest = targets[-1]
+        same = [target for target in targets if target.kind == newest.kind]
+        self.dropped += len(targets) - len(same)
+        if self.policy == "latest":
+            self.dropped += len(same) - 1
+            return [newest]
+        self.merged += len(same) - 1
+        return [average_targets(same)]
+
+    def drain(self, kind, port):
+        """Read the targets pending on a strict BufferedPortBottle and reduce them."""
+        if self.policy == "fifo":
+            count = min(port.getPendingReads(), 1)
+        else:
+            count = port.getPendingReads()
+        targets = []
+        for _ in range(count):
+            target = parse_target(kind, port.read(False), port)
+            if target is not None:
+                targets.append(target)
+        return self.reduce(targets)
+
+    def fill(self, bottle):
+        """Append (queue (policy P) (received N) (dropped N) (merged N))."""
+        entry = bottle.addList()
+        entry.addString("queue")
+        for key, value in (("policy", self.policy), ("received", self.received),
+                           ("dropped", self.dropped), ("merged", self.merged)):
+            item = entry.addList()
+            item.addString(key)
+            if isinstance(value, str):
+                item.addString(value)
+            else:
+                item.addInt64(value)
+
+
+def average_targets(targets):
+    """Merge targets of one kind into a single target at their mean position and mean stamp."""
+    values = tuple(sum(axis) / len(targets) for axis in zip(*(target.values for target in targets)))
+    if targets[0].kind == "camera":
+        values = tuple(int(round(value)) for value in values)
+    stamps = [target.stamp for target in targets if target.stamp is not None]
+    stamp = sum(stamps) / len(stamps) if stamps else None
+    return Target(targets[0].kind, values, stamp)
+
+
+class TargetWorker:
+    """
+    Process targets on a dedicated thread.
+
+    `submit()` returns immediately; the targets that accumulate while the
+    handler is busy are reduced by `queue` before being handled.
+    """
+
+    def __init__(self, handler, queue, name="targets"):
+        self.handler = handler
+        self.queue = queue
+        self.name = name
+        self._cond = threading.Condition()
+        self._pending = []
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+    def submit(self, target):
+        with self._cond:
+            self._pending.append(target)
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or not self._running)
+                if not self._running:
+                    return
+                if self.queue.policy == "fifo":
+                    pending = [self._pending.pop(0)]
+                else:
+                    pending, self._pending = self._pending, []
+                targets = self.queue.reduce(pending)
+            for target in targets:
+                self.handler(target)
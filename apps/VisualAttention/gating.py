@@ -0,0 +1,122 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import time
+import numpy as np
+
+
+class GazeCommandGate:
+    """
+    Decide whether a tracking target is worth a new gaze command.
+
+    Targets are compared, as directions seen from `viewpoint` (e.g. the eyes),
+    with the last commanded point:
+    - within `deadband` degrees, the gaze is already there and nothing is sent;
+    - beyond `switch_angle` degrees the target is taken as a different one, and
+      the gaze switches only after `switch_cycles` consecutive targets agree
+      (hysteresis against flickering detections);
+    - in between, the gaze follows, at most `max_rate` commands per second.
+    A zero `deadband`, `max_rate` or `switch_angle` disables that check.
+    """
+
+    def __init__(self, deadband=1.0, max_rate=20.0, switch_angle=15.0, switch_cycles=2):
+        self.deadband = np.radians(deadband)
+        self.min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self.switch_angle = np.radians(switch_angle)
+        self.switch_cycles = switch_cycles
+        self.viewpoint = np.zeros(3)
+        self._commanded = None
+        self._last_command = -np.inf
+        self._candidate = None
+        self._candidate_count = 0
+        self.targets = 0
+        self.commands = 0
+        self.deadband_suppressed = 0
+        self.rate_suppressed = 0
+        self.switch_suppressed = 0
+
+    def reset(self):
+        """Forget the last command, e.g. when tracking starts, so that the next target is always sent."""
+        self._commanded = None
+        self._candidate = None
+        self._candidate_count = 0
+
+    def _angle(self, a, b):
+        a, b = a - self.viewpoint, b - self.viewpoint
+        norm = np.linalg.norm(a) * np.linalg.norm(b)
+        if norm == 0.0:
+            return 0.0
+        return float(np.arccos(np.clip(a.dot(b) / norm, -1.0, 1.0)))
+
+    def should_command(self, point, now=None):
+        now = time.monotonic() if now is None else now
+        point = np.asarray(point, dtype=np.float64)
+        self.targets += 1
+
+        if self._commanded is not None:
+            angle = self._angle(point, self._commanded)
+            if angle <= self.deadband:
+                self._candidate = None
+                self.deadband_suppressed += 1
+                return False
+
+            if self.switch_angle > 0 and angle > self.switch_angle:
+                if self._candidate is not None and self._angle(point, self._candidate) <= self.switch_angle:
+                    self._candidate_count += 1
+                else:
+                    self._candidate_count = 1
+                self._candidate = point
+                if self._candidate_count < self.switch_cycles:
+                    self.switch_suppressed += 1
+                    return False
+            else:
+                self._candidate = None
+
+            if now - self._last_command < self.min_interval:
+                self.rate_suppressed += 1
+                return False
+
+        self._commanded = point
+        self._candidate = None
+        self._candidate_count = 0
+        self._last_command = now
+        self.commands += 1
+        return True
+
+    def stats(self):
+        return {
+            "targets": self.targets,
+            "commands": self.commands,
+            "deadband": self.deadband_suppressed,
+            "rate": self.rate_suppressed,
+            "switch": self.switch_suppressed,
+        }
@@ -0,0 +1,240 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import inspect
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    """A long-running behaviour (e.g. a scan) and its state: queued, running, done, cancelled or failed."""
+
+    def __init__(self, job_id, kind, function):
+        self.id = job_id
+        self.kind = kind
+        self.function = function
+        self.state = "queued"
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check(self):
+        """Raise JobCancelled if the job has been cancelled."""
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def fill(self, bottle):
+        """Append (id N) (kind K) (state S) (elapsed s) [(error E)]."""
+        end = self.finished if self.finished is not None else time.time()
+        elapsed = end - self.started if self.started is not None else 0.0
+        for key, value in (("id", self.id), ("kind", self.kind), ("state", self.state), ("elapsed", elapsed)):
+            entry = bottle.addList()
+            entry.addString(key)
+            if isinstance(value, int):
+                entry.addInt32(value)
+            elif isinstance(value, float):
+                entry.addFloat64(value)
+            else:
+                entry.addString(value)
+        if self.error is not None:
+            entry = bottle.addList()
+            entry.addString("error")
+            entry.addString(self.error)
+
+
+class GuardedGaze:
+    """
+    Gaze controller proxy handed to a job.
+
+    Every command is serialized with the other gaze users by `lock` and raises
+    JobCancelled once the job is cancelled, so that a behaviour built on top of
+    it stops at its next gaze command. Waits for the end of a motion run outside
+    the lock (they end early when a cancellation stops the motion), as do the
+    waits of blocking commands taking a `waitMotionDone` argument. Attributes
+    such as `IGazeControl` are guarded the same way.
+    """
+
+    WAIT_METHODS = ("wait_motion_done", "waitMotionDone")
+    WAIT_ARGUMENT = "waitMotionDone"
+
+    def __init__(self, gazectrl, job, lock):
+        self._gazectrl = gazectrl
+        self._job = job
+        self._lock = lock
+
+    def __getattr__(self, name):
+        attribute = getattr(self._gazectrl, name)
+        if not callable(attribute):
+            if attribute is None or isinstance(attribute, (bool, int, float, str, bytes, tuple)):
+                return attribute
+            return GuardedGaze(attribute, self._job, self._lock)
+
+        if name in self.WAIT_METHODS:
+            def wait(*args, **kwargs):
+                self._job.check()
+                result = attribute(*args, **kwargs)
+                self._job.check()
+                return result
+            return wait
+
+        def call(*args, **kwargs):
+            args, kwargs, timeout = self._defer_wait(attribute, args, kwargs)
+            with self._lock:
+                self._job.check()
+                result = attribute(*args, **kwargs)
+            if timeout is not None:
+                self._igaze().waitMotionDone(0.01, timeout)
+                self._job.check()
+            return result
+        return call
+
+    def _igaze(self):
+        return getattr(self._gazectrl, "IGazeControl", self._gazectrl)
+
+    def _defer_wait(self, function, args, kwargs):
+        """
+        Turn off the wait of a blocking command; return its arguments and the
+        timeout of the wait to do after it, or None if it does not wait.
+        """
+        try:
+            arguments = inspect.signature(function).bind(*args, **kwargs)
+        except (TypeError, ValueError):
+            return args, kwargs, None  # no Python signature (e.g. SWIG methods) or no match
+        arguments.apply_defaults()
+        if not arguments.arguments.get(self.WAIT_ARGUMENT):
+            return args, kwargs, None
+        arguments.arguments[self.WAIT_ARGUMENT] = False
+        timeout = arguments.arguments.get("timeout") or 0.0
+        return arguments.args, arguments.kwargs, timeout
+
+
+class JobRunner:
+    """
+    Run jobs one at a time on a worker thread.
+
+    Submitting a job preempts the running and queued ones. `on_cancel` is called
+    when a running job is cancelled, e.g. to stop the ongoing gaze motion.
+    """
+
+    def __init__(self, on_cancel=None, history=32, name="jobs"):
+        self.on_cancel = on_cancel
+        self.history = history
+        self.name = name
+        self._ids = itertools.count(1)
+        self._jobs = OrderedDict()
+        self._queue = deque()
+        self._current = None
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.cancel()
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+    def submit(self, kind, function):
+        """Queue `function(job)`, preempting the other jobs, and return the job id."""
+        self.cancel()
+        with self._cond:
+            job = Job(next(self._ids), kind, function)
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.history:
+                self._jobs.popitem(last=False)
+            self._queue.append(job)
+            self._cond.notify()
+        return job.id
+
+    def get(self, job_id=None):
+        """Return the job `job_id`, or the latest one, or None."""
+        with self._cond:
+            if job_id is None:
+                return next(reversed(self._jobs.values()), None)
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id=None):
+        """Cancel job `job_id`, or all the pending jobs; return whether anything was cancelled."""
+        with self._cond:
+            jobs = [job for job in list(self._queue) + [self._current]
+                    if job is not None and (job_id is None or job.id == job_id)]
+            for job in jobs:
+                job.cancel_event.set()
+                if job.state == "queued":
+                    job.state = "cancelled"
+                    self._queue.remove(job)
+            running = self._current in jobs
+        if running and self.on_cancel is not None:
+            self.on_cancel()
+        return len(jobs) > 0
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or not self._running)
+                if not self._running:
+                    return
+                job = self._queue.popleft()
+                job.state = "running"
+                job.started = time.time()
+                self._current = job
+            try:
+                job.function(job)
+                state = "cancelled" if job.cancelled else "done"
+            except JobCancelled:
+                state = "cancelled"
+            except Exception as e:
+                state = "cancelled" if job.cancelled else "failed"
+                job.error = None if job.cancelled else str(e)
+            with self._cond:
+                job.state = state
+                job.finished = time.time()
+                self._current = None
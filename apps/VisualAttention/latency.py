@@ -0,0 +1,77 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import numpy as np
+
+
+class LatencyStats:
+    """
+    End-to-end age of the targets acted upon, over the last `window` targets.
+
+    Ages are measured from the yarp.Stamp envelope of the target bottle, which the
+    producers (e.g. iFaceDetector) copy from the source camera image.
+    """
+
+    def __init__(self, window=512):
+        self._samples = np.zeros(window, dtype=np.float64)
+        self._index = 0
+        self.count = 0
+        self.dropped = 0
+        self.unstamped = 0
+
+    def add(self, age):
+        if age is None:
+            self.unstamped += 1
+            return
+        self._samples[self._index] = age
+        self._index = (self._index + 1) % len(self._samples)
+        self.count += 1
+
+    def summary(self):
+        """Return the statistics as a list of (key, value) pairs, latencies in ms."""
+        samples = self._samples[:min(self.count, len(self._samples))] * 1e3
+        values = [("mean", 0.0), ("p50", 0.0), ("p95", 0.0), ("p99", 0.0), ("max", 0.0)]
+        if samples.size > 0:
+            p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+            values = [("mean", float(samples.mean())), ("p50", float(p50)), ("p95", float(p95)),
+                      ("p99", float(p99)), ("max", float(samples.max()))]
+        return [("count", self.count)] + values + [("dropped", self.dropped), ("unstamped", self.unstamped)]
+
+    def fill(self, bottle):
+        """Append (count N) (mean ms) (p50 ms) (p95 ms) (p99 ms) (max ms) (dropped N) (unstamped N)."""
+        for key, value in self.summary():
+            entry = bottle.addList()
+            entry.addString(key)
+            if isinstance(value, int):
+                entry.addInt64(value)
+            else:
+                entry.addFloat64(value)
@@ -0,0 +1,201 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import threading
+import time
+import numpy as np
+import yarp
+from scan import EYES, region_points
+
+# Simulated cameras: 320x240, looking forward (-x in the root frame) from the eyes
+WIDTH, HEIGHT = 320, 240
+INTRINSICS = np.array([[257.3, 0.0, 160.0, 0.0], [0.0, 257.3, 120.0, 0.0], [0.0, 0.0, 1.0, 0.0]])
+# Columns: camera x (right) -> root +y, camera y (down) -> root -z, optical axis -> root -x
+EYE_ROTATION = np.array([[0.0, 0.0, -1.0], [1.0, 0.0, 0.0], [0.0, -1.0, 0.0]])
+EYE_BASELINE = 0.068
+
+
+def matrix_to_axis_angle(rotation):
+    """Axis-angle (ax, ay, az, theta) of a rotation matrix, as iKinGazeCtrl reports orientations."""
+    theta = np.arccos(np.clip((np.trace(rotation) - 1.0) / 2.0, -1.0, 1.0))
+    if np.isclose(theta, 0.0):
+        return (0.0, 0.0, 1.0, 0.0)
+    axis = np.array([rotation[2, 1] - rotation[1, 2], rotation[0, 2] - rotation[2, 0], rotation[1, 0] - rotation[0, 1]])
+    axis /= 2.0 * np.sin(theta)
+    return (axis[0], axis[1], axis[2], theta)
+
+
+class MockIGazeControl:
+    """
+    In-process stand-in for yarp.IGazeControl, without iKinGazeCtrl.
+
+    The fixation point moves linearly to each new target in `trajectory_time`
+    seconds; the eye poses are fixed, and get3DPoint back-projects with the
+    simulated intrinsics. Every call costs `rpc_delay` seconds, as a round trip
+    to the controller would.
+    """
+
+    def __init__(self, trajectory_time=0.5, rpc_delay=0.001):
+        self.trajectory_time = trajectory_time
+        self.rpc_delay = rpc_delay
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._start = np.array([-1.0, 0.0, EYES[2]])
+        self._target = self._start.copy()
+        self._started = -np.inf
+        self._eyes = [np.array(EYES) + (0.0, -EYE_BASELINE / 2.0, 0.0), np.array(EYES) + (0.0, EYE_BASELINE / 2.0, 0.0)]
+        self._inv_intrinsics = np.linalg.inv(INTRINSICS[:, :3])
+
+    def _rpc(self):
+        self.calls += 1
+        if self.rpc_delay > 0:
+            time.sleep(self.rpc_delay)
+
+    def _fixation(self, now):
+        progress = min((now - self._started) / self.trajectory_time, 1.0) if self.trajectory_time > 0 else 1.0
+        return self._start + progress * (self._target - self._start)
+
+    def lookAtFixationPoint(self, x):
+        self._rpc()
+        with self._lock:
+            now = time.monotonic()
+            self._start = self._fixation(now)
+            self._target = np.array([x[0], x[1], x[2]])
+            self._started = now
+        return True
+
+    def getFixationPoint(self, x):
+        with self._lock:
+            point = self._fixation(time.monotonic())
+        x[0], x[1], x[2] = point
+        return True
+
+    def checkMotionDone(self):
+        with self._lock:
+            return time.monotonic() - self._started >= self.trajectory_time
+
+    def waitMotionDone(self, period=0.1, timeout=0.0):
+        start = time.monotonic()
+        while not self.checkMotionDone():
+            if timeout > 0 and time.monotonic() - start > timeout:
+                return False
+            time.sleep(period)
+        return True
+
+    def stopControl(self):
+        self._rpc()
+        with self._lock:
+            now = time.monotonic()
+            self._start = self._target = self._fixation(now)
+            self._started = now - self.trajectory_time
+        return True
+
+    def getInfo(self, info):
+        self._rpc()
+        for name in ("left", "right"):
+            entry = info.addList()
+            entry.addString("camera_intrinsics_%s" % name)
+            values = entry.addList()
+            for value in INTRINSICS.ravel():
+                values.addFloat64(float(value))
+        return True
+
+    def _eye_pose(self, camera, x, o):
+        self._rpc()
+        for i in range(3):
+            x[i] = self._eyes[camera][i]
+        for i, value in enumerate(matrix_to_axis_angle(EYE_ROTATION)):
+            o[i] = value
+        return True
+
+    def getLeftEyePose(self, x, o, stamp=None):
+        return self._eye_pose(0, x, o)
+
+    def getRightEyePose(self, x, o, stamp=None):
+        return self._eye_pose(1, x, o)
+
+    def get3DPoint(self, camera, pixel, z, x):
+        self._rpc()
+        point = z * self._inv_intrinsics.dot((pixel[0], pixel[1], 1.0))
+        point = EYE_ROTATION.dot(point) + self._eyes[camera]
+        x[0], x[1], x[2] = point
+        return True
+
+
+class MockGazeController:
+    """Stand-in for pyicub's GazeController, backed by MockIGazeControl."""
+
+    def __init__(self, robot_name=None, logs=None, trajectory_time=0.5, rpc_delay=0.001):
+        self.robot_name = robot_name
+        self.IGazeControl = MockIGazeControl(trajectory_time, rpc_delay)
+        self.commands = []
+
+    def init(self):
+        pass
+
+    def look_at(self, point):
+        """Start moving the gaze to `point` and record the command time."""
+        x = yarp.Vector(3)
+        x[0], x[1], x[2] = point
+        self.commands.append(time.monotonic())
+        return self.IGazeControl.lookAtFixationPoint(x)
+
+    def wait_motion_done(self, timeout=0.0):
+        return self.IGazeControl.waitMotionDone(0.01, timeout)
+
+
+class MockAttention:
+    """
+    Stand-in for pyicub's VisualAttention on a MockGazeController.
+
+    A single point (tracking) is commanded without waiting; a list of points
+    (a scan) is visited in order, waiting for each motion and fixating for
+    `fixation_time` seconds. Scenes and workspaces are scanned row by row.
+    """
+
+    def __init__(self, gazectrl):
+        self.gazectrl = gazectrl
+
+    def observe_points(self, points, fixation_time=0.1):
+        if len(points) == 1:
+            self.gazectrl.look_at(points[0])
+            return
+        for point in points:
+            self.gazectrl.look_at(point)
+            self.gazectrl.wait_motion_done()
+            time.sleep(fixation_time)
+
+    def observe_scene(self, center, width, height):
+        self.observe_points(region_points("observe_scene", center, width, height, 3, 3), fixation_time=1.0)
+
+    def observe_workspace(self, center, width, depth):
+        self.observe_points(region_points("observe_workspace", center, width, depth, 3, 3), fixation_time=1.0)
@@ -0,0 +1,107 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import numpy as np
+
+
+class TargetPredictor:
+    """
+    Constant-velocity Kalman filter over target positions, to compensate latency.
+
+    Each axis is filtered independently with state (position, velocity) and
+    white-acceleration process noise of spectral density `process_noise`
+    [units^2/s^3]; measurements have standard deviation `measurement_noise`.
+    Measurements are timed by their envelope (acquisition) time, so `predict(t)`
+    extrapolates the target to the time `t` at which the gaze command is issued,
+    at most `max_horizon` seconds ahead of the last measurement. The filter
+    restarts after a gap longer than `reset_gap` seconds or a jump larger than
+    `reset_distance` from the prediction (e.g. a different target).
+    """
+
+    def __init__(self, process_noise=1.0, measurement_noise=0.02, max_horizon=0.3,
+                 reset_gap=0.5, reset_distance=0.5):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.max_horizon = max_horizon
+        self.reset_gap = reset_gap
+        self.reset_distance = reset_distance
+        self.resets = 0
+        self.reset()
+
+    def reset(self):
+        self._time = None
+        self._x = None      # (2, n): positions and velocities
+        self._p = None      # (2, 2) covariance, shared by the axes
+        self.updates = 0
+
+    def update(self, values, time):
+        """Add a measurement `values` taken at `time` [s]."""
+        z = np.asarray(values, dtype=np.float64)
+        r = self.measurement_noise ** 2
+        if self._time is not None and time <= self._time:
+            time = self._time  # out-of-order or duplicate stamp: update in place
+        if self._time is not None and (time - self._time > self.reset_gap or
+                                       np.linalg.norm(self._predicted(time) - z) > self.reset_distance):
+            self.resets += 1
+            self.reset()
+
+        if self._time is None:
+            self._x = np.vstack((z, np.zeros_like(z)))
+            self._p = np.diag((r, 1.0))
+            self._time = time
+            self.updates = 1
+            return
+
+        dt = time - self._time
+        f = np.array([[1.0, dt], [0.0, 1.0]])
+        q = self.process_noise * np.array([[dt ** 3 / 3.0, dt ** 2 / 2.0], [dt ** 2 / 2.0, dt]])
+        x = f.dot(self._x)
+        p = f.dot(self._p).dot(f.T) + q
+
+        gain = p[:, 0] / (p[0, 0] + r)
+        x += np.outer(gain, z - x[0])
+        p -= np.outer(gain, p[0, :])
+
+        self._x, self._p, self._time = x, p, time
+        self.updates += 1
+
+    def _predicted(self, time):
+        dt = min(max(time - self._time, 0.0), self.max_horizon)
+        return self._x[0] + dt * self._x[1]
+
+    def predict(self, time):
+        """Position extrapolated to `time` [s], or None before the first measurement."""
+        if self._time is None:
+            return None
+        if self.updates < 2:
+            return self._x[0].copy()
+        return self._predicted(time)
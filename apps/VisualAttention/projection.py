@@ -0,0 +1,114 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import time
+import numpy as np
+import yarp
+
+
+def axis_angle_to_matrix(o):
+    """Rotation matrix of an axis-angle orientation (ax, ay, az, theta), as returned by iKinGazeCtrl."""
+    axis = np.asarray(o[:3], dtype=np.float64)
+    norm = np.linalg.norm(axis)
+    if norm == 0.0:
+        return np.eye(3)
+    x, y, z = axis / norm
+    theta = o[3]
+    c, s = np.cos(theta), np.sin(theta)
+    k = np.array([[0.0, -z, y], [z, 0.0, -x], [-y, x, 0.0]])
+    return np.eye(3) + s * k + (1.0 - c) * k.dot(k)
+
+
+class CameraProjection:
+    """
+    Back-project camera pixels to the robot root frame locally, as iKinGazeCtrl's get3DPoint does.
+
+    The camera intrinsics are read once from the controller's info; the eye poses
+    are cached and refreshed at most every `refresh` seconds, so that a target
+    costs a few NumPy operations instead of an RPC round trip to iKinGazeCtrl.
+    """
+
+    CAMERAS = ("left", "right")
+
+    def __init__(self, igaze, refresh=0.05):
+        self.igaze = igaze
+        self.refresh = refresh
+        self.refreshes = 0
+        self._inv_intrinsics = [None, None]
+        self._poses = [None, None]
+        self._updated = [-np.inf, -np.inf]
+
+    def load_intrinsics(self):
+        """Read the intrinsics of both cameras from the controller; False if it does not provide them."""
+        info = yarp.Bottle()
+        if not self.igaze.getInfo(info):
+            return False
+        for camera, name in enumerate(self.CAMERAS):
+            values = info.find("camera_intrinsics_%s" % name).asList()
+            if values is None or values.size() != 12:
+                return False
+            projection = np.array([values.get(i).asFloat64() for i in range(12)]).reshape(3, 4)
+            self._inv_intrinsics[camera] = np.linalg.inv(projection[:, :3])
+        return True
+
+    def update_pose(self, camera, force=False):
+        """Refresh the cached pose of `camera` (0 left, 1 right) if older than `refresh`."""
+        now = time.monotonic()
+        if not force and now - self._updated[camera] < self.refresh:
+            return
+        x, o = yarp.Vector(3), yarp.Vector(4)
+        get_pose = self.igaze.getLeftEyePose if camera == 0 else self.igaze.getRightEyePose
+        if not get_pose(x, o):
+            raise RuntimeError("Cannot read the %s eye pose" % self.CAMERAS[camera])
+        rotation = axis_angle_to_matrix([o[i] for i in range(4)])
+        self._poses[camera] = (rotation, np.array([x[0], x[1], x[2]]))
+        self._updated[camera] = now
+        self.refreshes += 1
+
+    def position(self, camera):
+        """Cached root-frame position of `camera`, or None before the first refresh."""
+        pose = self._poses[camera]
+        return None if pose is None else pose[1]
+
+    def back_project(self, camera, pixels, z):
+        """
+        Return the (N, 3) root-frame points of (N, 2) `pixels` of `camera` at distance
+        `z` [m] along its optical axis.
+        """
+        self.update_pose(camera)
+        pixels = np.asarray(pixels, dtype=np.float64).reshape(-1, 2)
+        homogeneous = np.empty((len(pixels), 3))
+        homogeneous[:, :2] = pixels
+        homogeneous[:, 2] = 1.0
+        points = z * homogeneous.dot(self._inv_intrinsics[camera].T)
+        rotation, position = self._poses[camera]
+        return points.dot(rotation.T) + position
@@ -0,0 +1,131 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import functools
+import numpy as np
+
+# Approximate position of the eyes in the iCub root frame [m], used to turn
+# fixation points into gaze angles; it only affects the order of the points
+EYES = (-0.05, 0.0, 0.35)
+
+
+def region_points(kind, center, width, extent, rows, cols):
+    """
+    Fixation grid of a scan region: `observe_scene` spans a vertical plane (width
+    along y, `extent` = height along z), `observe_workspace` a horizontal one
+    (width along y, `extent` = depth along x).
+    """
+    cx, cy, cz = center
+    ys = np.linspace(cy - width / 2.0, cy + width / 2.0, cols) if cols > 1 else np.array([cy])
+    if kind == "observe_scene":
+        zs = np.linspace(cz - extent / 2.0, cz + extent / 2.0, rows) if rows > 1 else np.array([cz])
+        return np.array([(cx, y, z) for z in zs for y in ys])
+    xs = np.linspace(cx - extent / 2.0, cx + extent / 2.0, rows) if rows > 1 else np.array([cx])
+    return np.array([(x, y, cz) for x in xs for y in ys])
+
+
+def gaze_angles(points, eyes=EYES):
+    """Azimuth and elevation [rad] of the points seen from `eyes`, a proxy of the head/eye joints."""
+    d = np.asarray(points, dtype=np.float64) - np.asarray(eyes)
+    azimuth = np.arctan2(d[:, 1], -d[:, 0])
+    elevation = np.arctan2(d[:, 2], np.hypot(d[:, 0], d[:, 1]))
+    return np.column_stack((azimuth, elevation))
+
+
+def travel_costs(angles):
+    """Pairwise travel cost: joints move together, so the largest angle change dominates."""
+    return np.abs(angles[:, None, :] - angles[None, :, :]).max(axis=2)
+
+
+def path_cost(costs, order):
+    return float(costs[order[:-1], order[1:]].sum())
+
+
+def nearest_neighbour(costs, start):
+    order = [start]
+    left = set(range(len(costs))) - {start}
+    while left:
+        last = order[-1]
+        following = min(left, key=lambda j: costs[last, j])
+        order.append(following)
+        left.remove(following)
+    return np.array(order)
+
+
+def two_opt(costs, order):
+    """Improve an open path by reversing segments while that shortens it."""
+    order = order.copy()
+    n = len(order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(n - 2):
+            for j in range(i + 2, n):
+                a, b = order[i], order[i + 1]
+                before = costs[a, b]
+                after = costs[a, order[j]]
+                if j + 1 < n:
+                    before += costs[order[j], order[j + 1]]
+                    after += costs[b, order[j + 1]]
+                if after < before - 1e-12:
+                    order[i + 1:j + 1] = order[i + 1:j + 1][::-1]
+                    improved = True
+    return order
+
+
+def plan_tour(points, eyes=EYES):
+    """Order the points to minimize gaze travel: nearest neighbour from every start, refined by 2-opt."""
+    costs = travel_costs(gaze_angles(points, eyes))
+    best = None
+    for start in range(len(points)):
+        order = two_opt(costs, nearest_neighbour(costs, start))
+        cost = path_cost(costs, order)
+        if best is None or cost < best[0]:
+            best = (cost, order)
+    return best[1]
+
+
+@functools.lru_cache(maxsize=64)
+def scan_pattern(kind, center, width, extent, rows=3, cols=3):
+    """Travel-optimized fixation points of a scan region, as a tuple of (x, y, z); memoized per region."""
+    points = region_points(kind, center, width, extent, rows, cols)
+    return tuple(tuple(float(v) for v in points[i]) for i in plan_tour(points))
+
+
+def oriented(pattern, fixation):
+    """Run the pattern from the end nearest to the current `fixation` point (None: as planned)."""
+    if fixation is None or len(pattern) < 2:
+        return list(pattern)
+    angles = gaze_angles([pattern[0], pattern[-1], fixation])
+    if np.abs(angles[1] - angles[2]).max() < np.abs(angles[0] - angles[2]).max():
+        return list(reversed(pattern))
+    return list(pattern)
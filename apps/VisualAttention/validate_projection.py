@@ -0,0 +1,104 @@
+"""
+BSD 2-Clause License
+
+Copyright (c) 2025, Social Cognition in Human-Robot Interaction,
+                    Istituto Italiano di Tecnologia, Genova
+
+
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+import argparse
+import time
+import numpy as np
+import yarp
+from pyicub.controllers.gaze import GazeController
+from pyicub.core.logger import YarpLogger
+from projection import CameraProjection
+
+
+def remote_points(igaze, camera, pixels, depths):
+    """Back-project with one get3DPoint RPC per pixel."""
+    points = np.empty((len(pixels), 3))
+    pixel, point = yarp.Vector(2), yarp.Vector(3)
+    for i, ((u, v), z) in enumerate(zip(pixels, depths)):
+        pixel[0], pixel[1] = u, v
+        if not igaze.get3DPoint(camera, pixel, z, point):
+            raise RuntimeError("get3DPoint failed")
+        points[i] = (point[0], point[1], point[2])
+    return points
+
+
+def local_points(projection, camera, pixels, depths):
+    """Back-project locally, one batch per distinct depth."""
+    points = np.empty((len(pixels), 3))
+    for z in np.unique(depths):
+        mask = depths == z
+        points[mask] = projection.back_project(camera, pixels[mask], z)
+    return points
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Accuracy and speed of the local camera projection against get3DPoint")
+    parser.add_argument("--robot", default="icubSim")
+    parser.add_argument("--pixels", type=int, default=200, help="random pixels per camera")
+    parser.add_argument("--width", type=int, default=320)
+    parser.add_argument("--height", type=int, default=240)
+    parser.add_argument("--depths", type=float, nargs="+", default=[0.5, 1.0, 2.0], help="distances [m]")
+    args = parser.parse_args()
+
+    yarp.Network.init()
+    gazectrl = GazeController(args.robot, YarpLogger.getLogger())
+    gazectrl.init()
+    igaze = gazectrl.IGazeControl
+
+    projection = CameraProjection(igaze)
+    if not projection.load_intrinsics():
+        raise SystemExit("iKinGazeCtrl does not provide the camera intrinsics")
+
+    rng = np.random.default_rng(0)
+    print("%-6s %8s %12s %12s %14s %14s" % ("camera", "pixels", "mean[mm]", "max[mm]", "rpc[ms/px]", "local[ms/px]"))
+    for camera in (0, 1):
+        pixels = np.column_stack((rng.integers(0, args.width, args.pixels), rng.integers(0, args.height, args.pixels)))
+        depths = rng.choice(args.depths, args.pixels)
+
+        # The head must not move while measuring: both sides use the same eye pose
+        start = time.perf_counter()
+        expected = remote_points(igaze, camera, pixels, depths)
+        rpc = time.perf_counter() - start
+
+        start = time.perf_counter()
+        projection.update_pose(camera, force=True)
+        actual = local_points(projection, camera, pixels, depths)
+        local = time.perf_counter() - start
+
+        error = np.linalg.norm(actual - expected, axis=1) * 1e3
+        print("%-6s %8d %12.3f %12.3f %14.3f %14.4f" % (CameraProjection.CAMERAS[camera], len(pixels), error.mean(),
+                                                        error.max(), 1e3 * rpc / len(pixels), 1e3 * local / len(pixels)))
+    yarp.Network.fini()
+
+
+if __name__ == "__main__":
+    main()